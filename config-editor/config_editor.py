@@ -22,51 +22,238 @@ import sys
 import json
 import os
 import re
+import string
 import html
 import base64
 import hashlib
+import operator
+import mmap
+import tempfile
+import ssl
+import http.client
 import urllib.request
 import urllib.error
 import urllib.parse
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
 import threading
+import time
+import weakref
 
 try:
     from PyQt6.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-        QListWidget, QListWidgetItem, QStackedWidget, QLabel, QPushButton,
-        QLineEdit, QTextEdit, QTextBrowser, QSpinBox, QCheckBox, QComboBox, QGroupBox,
+        QListWidget, QListWidgetItem, QListView, QStackedWidget, QLabel, QPushButton,
+        QLineEdit, QTextBrowser, QSpinBox, QCheckBox, QComboBox, QGroupBox,
         QFormLayout, QFileDialog, QMessageBox, QScrollArea, QFrame,
-        QSplitter, QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView,
-        QDialog, QDialogButtonBox, QTreeWidget, QTreeWidgetItem, QToolButton,
-        QStyle, QSizePolicy, QGridLayout, QProgressDialog, QInputDialog,
-        QMenu, QWidgetAction, QProgressBar
+        QSplitter, QTabWidget, QDialog, QGridLayout, QProgressDialog,
+        QMenu, QProgressBar, QColorDialog
+    )
+    from PyQt6.QtCore import (
+        Qt, QSize, QAbstractListModel, QStringListModel, QModelIndex, pyqtSignal, QObject,
+        QThread, QRunnable, QThreadPool, QTimer, QUrl
+    )
+    from PyQt6.QtGui import (
+        QFont, QColor, QIcon, QAction, QPixmap, QPixmapCache, QPainter, QImage, QTextDocument
     )
-    from PyQt6.QtCore import Qt, QSize, pyqtSignal, QThread, QTimer, QByteArray, QUrl
-    from PyQt6.QtGui import QFont, QColor, QPalette, QIcon, QAction, QPixmap, QPainter, QImage, QTextDocument
     PYQT_VERSION = 6
 except ImportError:
     try:
         from PyQt5.QtWidgets import (
             QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-            QListWidget, QListWidgetItem, QStackedWidget, QLabel, QPushButton,
-            QLineEdit, QTextEdit, QTextBrowser, QSpinBox, QCheckBox, QComboBox, QGroupBox,
+            QListWidget, QListWidgetItem, QListView, QStackedWidget, QLabel, QPushButton,
+            QLineEdit, QTextBrowser, QSpinBox, QCheckBox, QComboBox, QGroupBox,
             QFormLayout, QFileDialog, QMessageBox, QScrollArea, QFrame,
-            QSplitter, QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView,
-            QDialog, QDialogButtonBox, QTreeWidget, QTreeWidgetItem, QToolButton,
-            QStyle, QSizePolicy, QGridLayout, QProgressDialog, QInputDialog,
-            QMenu, QWidgetAction, QProgressBar
+            QSplitter, QTabWidget, QDialog, QGridLayout, QProgressDialog,
+            QMenu, QProgressBar, QColorDialog
+        )
+        from PyQt5.QtCore import (
+            Qt, QSize, QAbstractListModel, QStringListModel, QModelIndex, pyqtSignal, QObject,
+            QThread, QRunnable, QThreadPool, QTimer, QUrl
+        )
+        from PyQt5.QtGui import (
+            QFont, QColor, QIcon, QPixmap, QPixmapCache, QPainter, QImage, QTextDocument
         )
-        from PyQt5.QtCore import Qt, QSize, pyqtSignal, QThread, QTimer, QByteArray, QUrl
-        from PyQt5.QtGui import QFont, QColor, QPalette, QIcon, QPixmap, QPainter, QImage, QTextDocument
         from PyQt5.QtWidgets import QAction
         PYQT_VERSION = 5
     except ImportError:
         print("Error: PyQt5 or PyQt6 is required. Install with: pip install PyQt6")
         sys.exit(1)
 
+# Optional fast JSON backend - orjson is used when installed, otherwise the
+# standard library, which writes exactly what json.dumps(indent=2) always has.
+# orjson output is not byte-identical: it keeps non-ASCII characters as UTF-8
+# instead of \uXXXX escapes, writes NaN/Infinity as null and rejects non-str
+# keys. Files saved with it may therefore differ once from the stdlib version.
+try:
+    import orjson
+
+    def _json_loads(data):
+        """Parse JSON from str or bytes."""
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        """Serialize obj to indented UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _json_dumps_compact(obj) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def _json_loads(data):
+        """Parse JSON from str or bytes."""
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        """Serialize obj to indented UTF-8 JSON bytes."""
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+    def _json_dumps_compact(obj) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _read_json(path: Path):
+    """Read and parse a JSON file, memory-mapping it when it is large."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if orjson is None or size < JSON_MMAP_THRESHOLD:
+            return _json_loads(f.read())
+        # orjson parses straight from the mapping, skipping the read() copy
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write data to path via a temp file + os.replace so readers never see a partial file.
+
+    The temp file is fsynced before the rename; otherwise a crash shortly
+    after saving can leave the renamed file empty on some filesystems. Each
+    write gets its own temp file, which is removed again if anything fails.
+    """
+    with tempfile.NamedTemporaryFile('w+b', dir=path.parent, prefix=path.name + '.',
+                                     suffix='.tmp', delete=False) as f:
+        tmp_path = f.name
+        try:
+            if len(data) < JSON_MMAP_WRITE_THRESHOLD:
+                f.write(data)
+                f.flush()
+            else:
+                # Copy straight into the page cache instead of through the file object's buffer
+                f.truncate(len(data))
+                with mmap.mmap(f.fileno(), len(data)) as mm:
+                    mm[:] = data
+            os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _git_blob_sha(data: bytes) -> str:
+    """Return the git blob SHA of data - the sha GitHub reports for a file with this content."""
+    header = b'blob %d\0' % len(data)
+    return hashlib.sha1(header + data).hexdigest()
+
+
+def _save_json(path: Path, obj):
+    """Serialize obj and write it to path atomically."""
+    _write_atomic(path, _json_dumps(obj))
+
+
+def _parse_id(text: str) -> int:
+    """Parse a numeric CurseForge id typed by the user; anything else counts as 0.
+
+    isdecimal() rather than isdigit(), which also accepts characters such as
+    superscripts that int() then rejects.
+    """
+    return int(text) if text.isdecimal() else 0
+
+
+def _version_parts(v: str) -> List[int]:
+    """Split a dotted version string into ints; blank or non-numeric parts count as 0."""
+    if not v or not v.strip():
+        return [0]
+    nums = []
+    for x in v.strip().split('.'):
+        x = x.strip()
+        try:
+            nums.append(int(x) if x else 0)
+        except ValueError:
+            nums.append(0)
+    return nums if nums else [0]
+
+
+def _version_keys(versions) -> Dict[str, Tuple[int, ...]]:
+    """Map each distinct version string to a zero-padded tuple sort key.
+
+    All keys share the same length, so plain tuple comparison orders them
+    exactly like MainWindow._compare_versions without re-parsing per compare.
+    """
+    parts = {v: _version_parts(v) for v in set(versions)}
+    width = max((len(p) for p in parts.values()), default=0)
+    return {v: tuple(p + [0] * (width - len(p))) for v, p in parts.items()}
+
+
+_option_models: Dict[Tuple[str, ...], Any] = {}
+
+
+def _option_model(options) -> 'QStringListModel':
+    """Shared read-only item model for a fixed list of combo box options.
+
+    Combos showing the same options share one model instead of each holding
+    its own copy of the items. Only use it for non-editable combos that are
+    never cleared or appended to, since that would change every user.
+    """
+    key = tuple(options)
+    model = _option_models.get(key)
+    if model is None:
+        model = _option_models[key] = QStringListModel(list(key))
+    return model
+
+
+@contextmanager
+def _signals_blocked(*objects):
+    """Block the signals of objects for the duration, restoring each one's previous state."""
+    was_blocked = [obj.blockSignals(True) for obj in objects]
+    try:
+        yield
+    finally:
+        for obj, blocked in zip(objects, was_blocked):
+            obj.blockSignals(blocked)
+
+
+@contextmanager
+def _bulk_update(widget):
+    """Suspend repaints and signals on widget while it is being repopulated.
+
+    Without this every added child triggers its own layout pass and repaint.
+    Views with sorting enabled also have it switched off for the duration.
+    """
+    was_sorting = getattr(widget, 'isSortingEnabled', lambda: False)()
+    if was_sorting:
+        widget.setSortingEnabled(False)
+    widget.setUpdatesEnabled(False)
+    was_blocked = widget.blockSignals(True)
+    try:
+        yield widget
+    finally:
+        widget.blockSignals(was_blocked)
+        if was_sorting:
+            widget.setSortingEnabled(True)
+        widget.setUpdatesEnabled(True)
+
 
 # === Configuration ===
 APP_NAME = "ModUpdater Config Editor"
@@ -75,6 +262,38 @@ CONFIG_FILE = "editor_config.json"
 CACHE_DIR = ".cache"
 USER_AGENT = "ModUpdater-ConfigEditor"
 DEFAULT_VERSION = "1.0.0"  # Default version for new mods/files
+JSON_MMAP_THRESHOLD = 64 * 1024  # Local JSON files at least this big are parsed via mmap
+JSON_MMAP_WRITE_THRESHOLD = 1024 * 1024  # Writes at least this big go through mmap
+PARSED_CONFIG_CACHE_SIZE = 16  # Parsed repository config files kept by blob SHA
+ETAG_CACHE_SIZE = 16  # GitHub GET responses kept for If-None-Match revalidation
+HASH_CHUNK_SIZE = 256 * 1024  # Read size when downloading a file to hash it
+CONNECTION_TEST_TTL = 60  # Seconds a successful "Test Connection" result is reused
+CONNECTION_TEST_FAILURE_TTL = 10  # Seconds a failed one is reused, so a fixed repo is retried soon
+
+# Patterns, compiled once here instead of on every call
+# GitHub repository URL -> (owner, repo). Pattern breakdown:
+# - github\.com[:/] - matches "github.com/" or "github.com:"
+# - ([^/]+) - captures the owner (anything except /)
+# - / - matches the separator
+# - ([^/\s]+?) - captures the repo name (non-greedy)
+# - (?:\.git)? - optionally matches ".git" suffix
+# - /?$ - optionally matches trailing slash at end
+GITHUB_REPO_RE = re.compile(r'github\.com[:/]([^/]+)/([^/\s]+?)(?:\.git)?/?$')
+HEX_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+THEME_KEY_UNSAFE_RE = re.compile(r'[^a-z0-9_]')
+# Validators use \Z so a trailing newline is rejected, and ASCII so \d is 0-9 only
+VERSION_RE = re.compile(r'^\d+\.\d+\.\d+\Z', re.ASCII)  # X.Y.Z only - no -beta, -rc, etc.
+# Mod IDs are a flat character allowlist, checked with a set rather than a regex
+MOD_ID_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+# Mod descriptions: CurseForge returns HTML, Modrinth returns Markdown
+HTML_TAG_RE = re.compile(r'<\s*(p|div|span|br|img|a|h[1-6]|ul|ol|li|strong|em|b|i)\b', re.IGNORECASE)
+SCRIPT_BLOCK_RE = re.compile(r'<script\b[^>]*>[\s\S]*?<\s*/\s*script[^>]*>', re.IGNORECASE)
+SCRIPT_TAG_RE = re.compile(r'<\s*/?script\b[^>]*>', re.IGNORECASE)
+EVENT_HANDLER_RE = re.compile(r'\s+on\w+\s*=\s*["\'][^"\']*["\']', re.IGNORECASE)
+JAVASCRIPT_HREF_RE = re.compile(r'href\s*=\s*["\']javascript:[^"\']*["\']', re.IGNORECASE)
+IMG_TAG_RE = re.compile(r'<img[^>]*/?>', re.IGNORECASE)
+IMG_SRC_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE)
+STYLE_ATTR_RE = re.compile(r'style=["\']([^"\']*)["\']', re.IGNORECASE)
 
 # Search/pagination settings
 SEARCH_PAGE_SIZE = 50  # Number of mods to load per page
@@ -159,7 +378,12 @@ MAX_DESCRIPTION_IMAGE_WIDTH = 400  # Maximum width for images in mod description
 
 # Icon loading settings (simplified)
 ICON_MAX_CONCURRENT_LOADS = 4  # Maximum number of concurrent icon downloads
+MOD_ICON_FETCH_THREADS = 8  # Worker threads fetching icons for the mods of an opened version
+MOD_ICON_DISK_CACHE_MAX_AGE = 7 * 24 * 3600  # Seconds a mod icon saved on disk is reused
 ICON_LOAD_DEBOUNCE_MS = 100  # Debounce delay for scroll events (ms)
+VALIDATION_DEBOUNCE_MS = 150  # Debounce delay for validating typed input (ms)
+
+PIXMAP_CACHE_LIMIT_KB = 20 * 1024  # Qt pixmap cache size, room for decoded icons
 
 # Preloading settings
 STARTUP_PRELOAD_PAGES = 1  # Number of pages to preload for each source on startup
@@ -453,11 +677,10 @@ def load_custom_themes():
     config_path = Path.home() / ".modupdater" / "custom_themes.json"
     if config_path.exists():
         try:
-            with open(config_path, 'r') as f:
-                _custom_themes = json.load(f)
-                # Merge with built-in themes
-                THEMES = dict(BUILTIN_THEMES)
-                THEMES.update(_custom_themes)
+            _custom_themes = _read_json(config_path)
+            # Merge with built-in themes
+            THEMES = dict(BUILTIN_THEMES)
+            THEMES.update(_custom_themes)
         except Exception:
             pass
 
@@ -467,8 +690,7 @@ def save_custom_themes():
     config_dir.mkdir(parents=True, exist_ok=True)
     config_path = config_dir / "custom_themes.json"
     try:
-        with open(config_path, 'w') as f:
-            json.dump(_custom_themes, f, indent=2)
+        _save_json(config_path, _custom_themes)
     except Exception as e:
         print(f"Failed to save custom themes: {e}")
 
@@ -511,7 +733,7 @@ QWidget {{
     font-size: 13px;
 }}
 
-QListWidget {{
+QListView {{
     background-color: {theme['bg_secondary']};
     border: none;
     border-radius: 8px;
@@ -520,7 +742,7 @@ QListWidget {{
     alternate-background-color: {theme['bg_primary']};
 }}
 
-QListWidget::item {{
+QListView::item {{
     background-color: {theme['bg_secondary']};
     border-radius: 6px;
     padding: 12px 16px;
@@ -528,21 +750,21 @@ QListWidget::item {{
     color: {theme['text_primary']};
 }}
 
-QListWidget::item:alternate {{
+QListView::item:alternate {{
     background-color: {theme['bg_primary']};
 }}
 
-QListWidget::item:selected {{
+QListView::item:selected {{
     background-color: {theme['accent']};
     color: {theme['bg_primary']};
 }}
 
-QListWidget::item:selected:alternate {{
+QListView::item:selected:alternate {{
     background-color: {theme['accent']};
     color: {theme['bg_primary']};
 }}
 
-QListWidget::item:hover:!selected {{
+QListView::item:hover:!selected {{
     background-color: {theme['bg_tertiary']};
 }}
 
@@ -794,13 +1016,185 @@ QMenu::item:selected {{
 QDialog {{
     background-color: {theme['bg_primary']};
 }}
+
+QWidget#sidebar {{
+    background-color: {theme['bg_sidebar']};
+}}
+
+QFrame#editorContainer, QFrame#editorContainer QFrame {{
+    background-color: {theme['bg_secondary']};
+    border: none;
+    border-radius: 8px;
+    margin: 4px;
+}}
+
+QFrame#editorContainer QScrollBar:vertical {{
+    background-color: {theme['bg_secondary']};
+    width: 12px;
+    border-radius: 6px;
+}}
+
+QFrame#editorContainer QScrollBar::handle:vertical {{
+    background-color: {theme['border']};
+    border-radius: 4px;
+    min-height: 30px;
+}}
+
+QFrame#editorContainer QScrollBar::handle:vertical:hover {{
+    background-color: {theme['accent']};
+}}
+
+QLabel#placeholderLabel {{
+    color: {theme['text_secondary']};
+    font-size: 16px;
+    font-style: italic;
+    background-color: transparent;
+    padding: 16px;
+}}
+
+QLabel#setupStatus[state="working"] {{
+    color: {theme['warning']};
+}}
+
+QLabel#setupStatus[state="ok"] {{
+    color: {theme['success']};
+}}
+
+QLabel#setupStatus[state="error"] {{
+    color: {theme['danger']};
+}}
+
+ItemCard {{
+    background-color: {theme['bg_secondary']};
+    border: 2px solid {theme['border']};
+    border-radius: 8px;
+}}
+
+ItemCard:hover {{
+    border-color: {theme['accent']};
+}}
+
+ItemCard[selected="true"] {{
+    background-color: {theme['accent']};
+    border-color: {theme['accent']};
+}}
+
+ItemCard QLabel#cardIcon {{
+    font-size: 28px;
+    background-color: transparent;
+    color: {theme['text_primary']};
+}}
+
+ItemCard[addButton="true"] QLabel#cardIcon {{
+    font-size: 36px;
+    font-weight: bold;
+}}
+
+ItemCard QLabel#cardName {{
+    font-size: 11px;
+    background-color: transparent;
+    color: {theme['text_primary']};
+}}
+
+ItemCard[selected="true"] QLabel#cardName {{
+    color: {theme['bg_primary']};
+}}
 """
 
 
+def _minify_qss(qss: str) -> str:
+    """Drop comments and insignificant whitespace so Qt's QSS lexer scans fewer bytes."""
+    qss = re.sub(r'/\*.*?\*/', '', qss, flags=re.S)
+    qss = re.sub(r'\s*([{};:,])\s*', r'\1', qss)
+    return re.sub(r'\s+', ' ', qss).strip()
+
+
+_stylesheet_cache: Dict[tuple, str] = {}
+
+
+def apply_stylesheet(theme: dict):
+    """Set the application-wide stylesheet for theme.
+
+    The generated QSS is minified and cached per theme, and setStyleSheet is
+    skipped when the same sheet is already active, since every call makes Qt
+    re-parse it and re-polish every widget.
+    """
+    key = tuple(sorted(theme.items()))
+    sheet = _stylesheet_cache.get(key)
+    if sheet is None:
+        sheet = _stylesheet_cache[key] = _minify_qss(generate_stylesheet(theme))
+    app = QApplication.instance()
+    if app.styleSheet() != sheet:
+        app.setStyleSheet(sheet)
+
+
 
 # === GitHub API Helper ===
+class _KeepAliveHTTPS:
+    """Persistent HTTPS connections to one host, shared between threads.
+
+    urlopen sets up a new TCP connection and TLS session for every call, and
+    saving or fetching a config makes several calls in a row to the same host.
+    """
+
+    def __init__(self, host: str, max_idle: int = 4):
+        self.host = host
+        self.max_idle = max_idle
+        self._idle: List[http.client.HTTPSConnection] = []
+        self._lock = threading.Lock()
+        self._context = ssl.create_default_context()
+
+    def _acquire(self, timeout: float, fresh: bool):
+        if not fresh:
+            with self._lock:
+                if self._idle:
+                    conn = self._idle.pop()
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+        return http.client.HTTPSConnection(self.host, timeout=timeout, context=self._context), False
+
+    def _release(self, conn: http.client.HTTPSConnection):
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, method: str, path: str, body: bytes = None, headers: dict = None, timeout: float = 30):
+        """Send a request and return (status, headers, body bytes)."""
+        for attempt in range(2):
+            conn, reused = self._acquire(timeout, fresh=attempt > 0)
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                payload = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused and attempt == 0:
+                    continue  # The server dropped the idle connection; retry on a new one
+                raise
+            except Exception:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return response.status, response.headers, payload
+
+
 class GitHubAPI:
     """Helper class for GitHub API operations."""
+    # Last GET response body per (token, endpoint) with its ETag, so unchanged resources
+    # are revalidated with If-None-Match; a 304 doesn't count against the rate limit.
+    # Shared by all instances, since the setup dialog and reconfiguring create new ones,
+    # and bounded to the ETAG_CACHE_SIZE most recently used entries.
+    _etag_cache: Dict[Tuple[str, str], Tuple[str, bytes]] = {}
+    _etag_lock = threading.Lock()
+    # Only endpoints whose content can change are worth revalidating: directory
+    # listings, file contents and branches. Blobs are addressed by their SHA.
+    _ETAG_ENDPOINT_RE = re.compile(r'/contents/|/branches$')
 
     def __init__(self, repo_url: str, token: str = ""):
         self.token = token
@@ -808,6 +1202,10 @@ class GitHubAPI:
         self.owner, self.repo = self._parse_repo_url(repo_url)
         self.api_base = "https://api.github.com"
         self.branch = "main"
+        # Keep-alive connections, unless requests have to go through a proxy
+        self._connections = None
+        if 'https' not in urllib.request.getproxies():
+            self._connections = _KeepAliveHTTPS(urllib.parse.urlsplit(self.api_base).netloc)
 
     def _parse_repo_url(self, url: str) -> Tuple[str, str]:
         """Parse owner and repo from GitHub URL.
@@ -818,21 +1216,17 @@ class GitHubAPI:
         - https://github.com/owner/repo/
         - git@github.com:owner/repo.git
         """
-        # Pattern breakdown:
-        # - github\.com[:/] - matches "github.com/" or "github.com:"
-        # - ([^/]+) - captures the owner (anything except /)
-        # - / - matches the separator
-        # - ([^/\s]+?) - captures the repo name (non-greedy)
-        # - (?:\.git)? - optionally matches ".git" suffix
-        # - /?$ - optionally matches trailing slash at end
-        pattern = r'github\.com[:/]([^/]+)/([^/\s]+?)(?:\.git)?/?$'
-        match = re.search(pattern, url)
+        match = GITHUB_REPO_RE.search(url)
         if match:
             return match.group(1), match.group(2).replace('.git', '')
         raise ValueError(f"Invalid GitHub URL: {url}")
 
     def _request(self, method: str, endpoint: str, data: dict = None) -> dict:
-        """Make a request to GitHub API."""
+        """Make a request to GitHub API.
+
+        A GET answered with 304 Not Modified is parsed again from the body
+        cached with the earlier response.
+        """
         url = f"{self.api_base}{endpoint}"
         headers = {
             "Accept": "application/vnd.github.v3+json",
@@ -842,19 +1236,60 @@ class GitHubAPI:
             headers["Authorization"] = f"token {self.token}"
 
         if data:
-            body = json.dumps(data).encode('utf-8')
+            body = _json_dumps_compact(data)
             headers["Content-Type"] = "application/json"
         else:
             body = None
 
+        cached = self._etag_lookup(endpoint) if self._use_etag(method, endpoint) else None
+        if cached:
+            headers["If-None-Match"] = cached[0]
+
+        if self._connections is not None:
+            status, response_headers, payload = self._connections.request(
+                method, endpoint, body, headers, timeout=30)
+            if status == 304 and cached:
+                return _json_loads(cached[1])
+            if status >= 400:
+                raise GitHubAPIError(status, payload.decode('utf-8', 'replace'))
+            if status < 300:
+                return self._parse_response(method, endpoint, response_headers, payload)
+            # Redirects (e.g. a renamed repository) are followed by urllib below
+
         req = urllib.request.Request(url, data=body, headers=headers, method=method)
         try:
             with urllib.request.urlopen(req, timeout=30) as response:
-                return json.loads(response.read().decode('utf-8'))
+                return self._parse_response(method, endpoint, response.headers, response.read())
         except urllib.error.HTTPError as e:
+            if e.code == 304 and cached:
+                return _json_loads(cached[1])
             error_body = e.read().decode('utf-8') if e.fp else ""
             raise GitHubAPIError(e.code, error_body)
 
+    def _use_etag(self, method: str, endpoint: str) -> bool:
+        return method == "GET" and self._ETAG_ENDPOINT_RE.search(endpoint) is not None
+
+    def _etag_lookup(self, endpoint: str) -> Optional[Tuple[str, bytes]]:
+        key = (self.token, endpoint)
+        with self._etag_lock:
+            cached = self._etag_cache.pop(key, None)
+            if cached is not None:
+                self._etag_cache[key] = cached  # Move to the most recently used end
+            return cached
+
+    def _parse_response(self, method: str, endpoint: str, headers, payload: bytes):
+        result = _json_loads(payload)
+        etag = headers.get('ETag')
+        if etag and self._use_etag(method, endpoint):
+            cache = self._etag_cache
+            with self._etag_lock:
+                cache.pop((self.token, endpoint), None)
+                cache[(self.token, endpoint)] = (etag, payload)
+                while len(cache) > ETAG_CACHE_SIZE:
+                    # Dicts keep insertion order, so the first key is the least recently used
+                    del cache[next(iter(cache))]
+        return result
+
     def get_file(self, path: str) -> Tuple[str, str]:
         """Get file content and SHA from repository."""
         endpoint = f"/repos/{self.owner}/{self.repo}/contents/{path}?ref={self.branch}"
@@ -867,6 +1302,12 @@ class GitHubAPI:
                 return None, None
             raise
 
+    def get_blob(self, sha: str) -> str:
+        """Get the content of a blob by its SHA (no size limit, unlike get_file)."""
+        endpoint = f"/repos/{self.owner}/{self.repo}/git/blobs/{sha}"
+        data = self._request("GET", endpoint)
+        return base64.b64decode(data['content']).decode('utf-8')
+
     def list_directory(self, path: str = "") -> List[dict]:
         """List contents of a directory."""
         endpoint = f"/repos/{self.owner}/{self.repo}/contents/{path}?ref={self.branch}"
@@ -877,12 +1318,17 @@ class GitHubAPI:
                 return []
             raise
 
-    def create_or_update_file(self, path: str, content: str, message: str, sha: str = None) -> dict:
-        """Create or update a file in the repository."""
+    def create_or_update_file(self, path: str, content, message: str, sha: str = None) -> dict:
+        """Create or update a file in the repository.
+
+        content may be a str or already-encoded UTF-8 bytes.
+        """
         endpoint = f"/repos/{self.owner}/{self.repo}/contents/{path}"
+        if isinstance(content, str):
+            content = content.encode('utf-8')
         data = {
             "message": message,
-            "content": base64.b64encode(content.encode('utf-8')).decode('utf-8'),
+            "content": base64.b64encode(content).decode('ascii'),
             "branch": self.branch
         }
         if sha:
@@ -976,7 +1422,7 @@ class RemoteImageTextBrowser(QTextBrowser):
             # Use position:relative with z-index:1 to ensure proper layering
             style_to_add = 'max-width: 100%; height: auto; display: block; position: relative; z-index: 1; margin: 8px 0;'
             # Check if style already exists
-            style_match = re.search(r'style=["\']([^"\']*)["\']', img_tag, re.IGNORECASE)
+            style_match = STYLE_ATTR_RE.search(img_tag)
             if style_match:
                 # Append to existing style
                 existing_style = style_match.group(1).rstrip(';')
@@ -990,11 +1436,10 @@ class RemoteImageTextBrowser(QTextBrowser):
                     img_tag = img_tag.rstrip()[:-1] + f' style="{style_to_add}">'
             return img_tag
 
-        html = re.sub(r'<img[^>]*/?>', add_img_style, html, flags=re.IGNORECASE)
+        html = IMG_TAG_RE.sub(add_img_style, html)
 
         # Find all image URLs in the HTML
-        img_pattern = r'<img[^>]+src=["\']([^"\']+)["\']'
-        urls = re.findall(img_pattern, html, re.IGNORECASE)
+        urls = IMG_SRC_RE.findall(html)
 
         # Queue loading for URLs not in cache
         for url in urls:
@@ -1087,53 +1532,95 @@ class RemoteImageTextBrowser(QTextBrowser):
 # Simple and lightweight icon loading system
 
 
-class IconFetcher(QThread):
-    """Background thread for fetching mod icons from source info."""
-    icon_fetched = pyqtSignal(str, bytes)  # mod_id, icon_bytes
-    fetch_complete = pyqtSignal()
+class ModIconSignals(QObject):
+    """Signals for ModIconTask."""
+    icon_fetched = pyqtSignal(int, bytes)  # mod_index, icon_bytes
 
-    def __init__(self, mod_info: dict):
-        super().__init__()
-        self.mod_info = mod_info
-        self._running = True
 
-    def run(self):
-        """Fetch icon from CurseForge or Modrinth."""
-        source = self.mod_info.get('source', {})
-        source_type = source.get('type', '')
-        mod_id = self.mod_info.get('id', self.mod_info.get('numberId', ''))
+class ModIconTask(QRunnable):
+    """Fetch the icon of one mod in a version from its CurseForge or Modrinth project.
 
-        try:
-            icon_data = None
-            if source_type == 'modrinth':
-                project_slug = source.get('projectSlug')
-                if project_slug:
-                    icon_data = self._fetch_modrinth_icon(project_slug)
+    Tasks run on a dedicated, bounded pool so opening a large version queues
+    its icon downloads instead of starting a thread per mod.
+    """
+    # Icons fetched this session by (source type, project id/slug), shared by all versions.
+    # They are also saved on disk so the next launch doesn't download them again.
+    _cache: Dict[Tuple[str, str], bytes] = {}
+    _pool: Optional[QThreadPool] = None
+    _SAFE_NAME_RE = re.compile(r'[^A-Za-z0-9_.-]')
+
+    def __init__(self, source_type: str, project: str, mod_index: int,
+                 signals: ModIconSignals, cancelled: threading.Event):
+        super().__init__()
+        self.source_type = source_type
+        self.project = project
+        self.mod_index = mod_index
+        self.signals = signals
+        self.cancelled = cancelled  # Set when the version is closed or reloaded
 
-            if icon_data and self._running:
-                self.icon_fetched.emit(mod_id, icon_data)
-        except (urllib.error.URLError, urllib.error.HTTPError, OSError):
-            pass  # Silently ignore network errors
+    @classmethod
+    def pool(cls) -> QThreadPool:
+        if cls._pool is None:
+            cls._pool = QThreadPool()
+            cls._pool.setMaxThreadCount(MOD_ICON_FETCH_THREADS)
+        return cls._pool
 
-        self.fetch_complete.emit()
+    @classmethod
+    def _disk_path(cls, source_type: str, project: str) -> Path:
+        name = cls._SAFE_NAME_RE.sub('_', f"{source_type}_{project}")
+        return Path.home() / ".modupdater" / CACHE_DIR / "icons" / f"{name}.bin"
 
-    def _fetch_modrinth_icon(self, project_slug: str) -> bytes:
-        """Fetch icon from Modrinth API."""
-        try:
-            url = f"https://api.modrinth.com/v2/project/{project_slug}"
-            req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read())
-                icon_url = data.get('icon_url')
-                if icon_url:
-                    with urllib.request.urlopen(icon_url, timeout=10) as img_response:
-                        return img_response.read()
-        except (urllib.error.URLError, urllib.error.HTTPError, OSError):
-            pass  # Silently ignore network errors
-        return None
+    @classmethod
+    def cached(cls, source_type: str, project: str) -> Optional[bytes]:
+        """Return the icon from memory or a fresh enough disk copy, else None."""
+        key = (source_type, project)
+        icon_data = cls._cache.get(key)
+        if icon_data is None:
+            path = cls._disk_path(source_type, project)
+            try:
+                if time.time() - path.stat().st_mtime < MOD_ICON_DISK_CACHE_MAX_AGE:
+                    icon_data = cls._cache[key] = path.read_bytes()
+            except OSError:
+                pass
+        return icon_data
 
-    def stop(self):
-        self._running = False
+    def run(self):
+        if self.cancelled.is_set():
+            return
+        try:
+            icon_url = self._icon_url()
+            if not icon_url or self.cancelled.is_set():
+                return
+            req = urllib.request.Request(icon_url, headers={"User-Agent": USER_AGENT})
+            with urllib.request.urlopen(req, timeout=10) as img_response:
+                icon_data = img_response.read()
+        except Exception:
+            return  # Silently fail icon loads
+        if icon_data:
+            self._cache[(self.source_type, self.project)] = icon_data
+            try:
+                path = self._disk_path(self.source_type, self.project)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                _write_atomic(path, icon_data)
+            except OSError:
+                pass  # Still shown, just not kept for the next launch
+            if not self.cancelled.is_set():
+                self.signals.icon_fetched.emit(self.mod_index, icon_data)
+
+    def _icon_url(self) -> str:
+        """Look up the project's icon URL."""
+        if self.source_type == 'modrinth':
+            url = f"https://api.modrinth.com/v2/project/{self.project}"
+        else:
+            # Use curse.tools proxy API
+            url = f"{CF_PROXY_BASE_URL}/mods/{self.project}"
+        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        with urllib.request.urlopen(req, timeout=10) as response:
+            data = _json_loads(response.read())
+        if self.source_type == 'modrinth':
+            return data.get('icon_url') or ''
+        logo = data.get('data', {}).get('logo', {})
+        return logo.get('thumbnailUrl', '') or logo.get('url', '')
 
 
 class SimpleIconFetcher(QThread):
@@ -1169,78 +1656,440 @@ class SimpleIconFetcher(QThread):
         self._running = False
 
 
+def _cached_pixmap(key: str, load, size: int) -> QPixmap:
+    """Look up key in Qt's global pixmap cache, loading and scaling on a miss.
+
+    With a size the cached pixmap is already scaled to fit size x size, so
+    callers showing the same icon again skip both the decode and the resample.
+    """
+    if size:
+        key = f"{key}:{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = load()
+        if not pixmap.isNull():
+            if size:
+                pixmap = _fit_pixmap(pixmap, size)
+            QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _fit_pixmap(pixmap: QPixmap, size: int) -> QPixmap:
+    """Scale pixmap to fit size x size, keeping its aspect ratio.
+
+    Icons already that size are returned as they are. Images over twice the
+    size are first reduced to twice the size with a fast transformation, since
+    the smooth one's cost grows with the source area.
+    """
+    longest = max(pixmap.width(), pixmap.height())
+    if longest == size:
+        return pixmap
+    if longest > 2 * size:
+        pixmap = pixmap.scaled(2 * size, 2 * size, Qt.AspectRatioMode.KeepAspectRatio,
+                               Qt.TransformationMode.FastTransformation)
+    return pixmap.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                         Qt.TransformationMode.SmoothTransformation)
+
+
+def load_pixmap(path: str, size: int = 0) -> QPixmap:
+    """Load an image file through Qt's global pixmap cache.
+
+    The cache key includes the file's mtime so a replaced icon is re-read.
+    Returns a null QPixmap if the file is missing or unreadable, so callers
+    don't need to check that it exists first.
+    """
+    try:
+        key = f"file:{path}:{os.stat(path).st_mtime_ns}"
+    except OSError:
+        return QPixmap()
+    return _cached_pixmap(key, lambda: QPixmap(path), size)
+
+
+def load_pixmap_from_data(data: bytes, size: int = 0) -> QPixmap:
+    """Decode image bytes through Qt's global pixmap cache.
+
+    Icon bytes are shared by every card showing the same mod, and Python
+    caches the hash of a bytes object, so the key is cheap after first use.
+    """
+    def load():
+        pixmap = QPixmap()
+        pixmap.loadFromData(data)
+        return pixmap
+    return _cached_pixmap(f"data:{hash(data)}:{len(data)}", load, size)
+
+
 # === Hash Calculator ===
-class HashCalculator(QThread):
-    """Background thread for calculating file hashes."""
+# SHA-256 of downloaded files by URL, size and ETag/Last-Modified, kept across sessions
+_hash_cache: Optional[Dict[str, str]] = None  # Loaded on first use
+# Downloads in progress by URL; a second request for the same URL waits for the first
+_hash_inflight: Dict[str, Future] = {}
+_hash_lock = threading.Lock()
+
+
+def _hash_cache_path() -> Path:
+    return Path.home() / ".modupdater" / CACHE_DIR / "hashes.json"
+
+
+def _cached_download_hash(key: str) -> Optional[str]:
+    global _hash_cache
+    with _hash_lock:
+        if _hash_cache is None:
+            try:
+                _hash_cache = _read_json(_hash_cache_path())
+            except Exception:
+                _hash_cache = {}
+        return _hash_cache.get(key)
+
+
+def _store_download_hash(key: str, digest: str):
+    with _hash_lock:
+        _hash_cache[key] = digest
+        try:
+            path = _hash_cache_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _save_json(path, _hash_cache)
+        except OSError:
+            pass  # The cache is only an optimization
+
+
+class HashSignals(QObject):
+    """Signals for HashCalculator (QRunnable itself cannot emit)."""
     hash_calculated = pyqtSignal(str)
     progress_updated = pyqtSignal(int)
     error_occurred = pyqtSignal(str)
 
+
+class HashCalculator(QRunnable):
+    """Download a file on the global thread pool and calculate its SHA-256."""
+
     def __init__(self, url: str):
         super().__init__()
         self.url = url
+        self.signals = HashSignals()
         self._running = True
 
     def run(self):
         """Download file and calculate SHA-256 hash."""
+        with _hash_lock:
+            flight = _hash_inflight.get(self.url)
+            leading = flight is None
+            if leading:
+                flight = _hash_inflight[self.url] = Future()
         try:
-            req = urllib.request.Request(self.url, headers={"User-Agent": USER_AGENT})
-            with urllib.request.urlopen(req, timeout=60) as response:
-                total_size = int(response.headers.get('content-length', 0))
-                downloaded = 0
-                hasher = hashlib.sha256()
-
-                while self._running:
-                    chunk = response.read(8192)
-                    if not chunk:
-                        break
-                    hasher.update(chunk)
-                    downloaded += len(chunk)
-                    if total_size > 0:
-                        progress = int((downloaded / total_size) * 100)
-                        self.progress_updated.emit(progress)
-
-                if self._running:
-                    self.hash_calculated.emit(hasher.hexdigest())
+            if leading:
+                try:
+                    digest = self._download()
+                except Exception as e:
+                    flight.set_exception(e)
+                    raise
+                flight.set_result(digest)
+            else:
+                digest = self._wait_for(flight)
+                if digest is None and self._running:
+                    digest = self._download()  # The other download was stopped
+
+            if digest and self._running:
+                self.signals.hash_calculated.emit(digest)
         except Exception as e:
             if self._running:
-                self.error_occurred.emit(str(e))
+                self.signals.error_occurred.emit(str(e))
+        finally:
+            if leading:
+                with _hash_lock:
+                    _hash_inflight.pop(self.url, None)
+
+    def _wait_for(self, flight: Future) -> Optional[str]:
+        """Wait for another calculator's download of the same URL."""
+        while self._running:
+            try:
+                return flight.result(timeout=0.25)
+            except FutureTimeoutError:
+                continue
+        return None
+
+    def _download(self) -> Optional[str]:
+        """Download the file and return its SHA-256, or None if stopped."""
+        req = urllib.request.Request(self.url, headers={"User-Agent": USER_AGENT})
+        with urllib.request.urlopen(req, timeout=60) as response:
+            total_size = int(response.headers.get('content-length', 0))
+            # Without a validator there is no way to tell the file hasn't changed
+            validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+            key = f"{self.url}\n{total_size}\n{validator}" if validator else None
+            if key:
+                digest = _cached_download_hash(key)
+                if digest:
+                    return digest  # Closing the response skips the body
+
+            downloaded = 0
+            last_progress = -1
+            hasher = hashlib.sha256()
+            # One reusable buffer instead of a new bytes object per read
+            buffer = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+
+            while self._running:
+                n = response.readinto(buffer)
+                if not n:
+                    break
+                hasher.update(view[:n])
+                downloaded += n
+                if total_size > 0:
+                    progress = int((downloaded / total_size) * 100)
+                    # Only signal actual changes; each emit is queued to the GUI thread
+                    if progress != last_progress:
+                        last_progress = progress
+                        self.signals.progress_updated.emit(progress)
+
+            if not self._running:
+                return None
+            digest = hasher.hexdigest()
+        if key:
+            _store_download_hash(key, digest)
+        return digest
+
+    def stop(self):
+        self._running = False
+
+
+# === Background Save ===
+class SaveSignals(QObject):
+    """Signals for SaveTask (QRunnable itself cannot emit)."""
+    finished = pyqtSignal(str, str)  # path, error message ('' on success)
+
+
+class SaveTask(QRunnable):
+    """Write a JSON file atomically on a dedicated single-thread pool.
+
+    One worker means saves land in the order they were made, so an older
+    snapshot can never overwrite a newer one.
+    """
+    _pool: Optional[QThreadPool] = None
+
+    def __init__(self, path: Path, obj):
+        super().__init__()
+        self.path = path
+        # Serialize up front so later edits to obj can't race the worker
+        self.data = _json_dumps(obj)
+        self.signals = SaveSignals()
+
+    def run(self):
+        try:
+            _write_atomic(self.path, self.data)
+            error = ''
+        except Exception as e:
+            error = str(e)
+        self.signals.finished.emit(str(self.path), error)
+
+    @classmethod
+    def pool(cls) -> QThreadPool:
+        if cls._pool is None:
+            cls._pool = QThreadPool()
+            cls._pool.setMaxThreadCount(1)
+        return cls._pool
+
+    @classmethod
+    def submit(cls, task: 'SaveTask'):
+        """Queue task, dropping any saves still waiting - only the newest snapshot matters."""
+        pool = cls.pool()
+        pool.clear()
+        pool.start(task)
+
+
+class ConnectionTestSignals(QObject):
+    """Signals for ConnectionTestTask."""
+    finished = pyqtSignal(bool, str)  # reachable, error message ('' unless the test raised)
+
+
+class ConnectionTestTask(QRunnable):
+    """Check that a GitHub repository is reachable, on the global thread pool."""
+
+    def __init__(self, repo_url: str, token: str):
+        super().__init__()
+        self.repo_url = repo_url
+        self.token = token
+        self.signals = ConnectionTestSignals()
+
+    def run(self):
+        try:
+            ok = GitHubAPI(self.repo_url, self.token).test_connection()
+            error = ''
+        except Exception as e:
+            ok, error = False, str(e)
+        self.signals.finished.emit(ok, error)
+
+
+class ConfigFetchSignals(QObject):
+    """Signals for ConfigFetchTask."""
+    finished = pyqtSignal(object)  # {filename: (parsed data or None, sha, error or None)}
+
+
+# Parsed config files keyed by git blob SHA. The SHA pins the exact content,
+# so a refresh that finds a file unchanged reuses the earlier parse.
+_parsed_config_cache: Dict[str, Any] = {}
+_parsed_config_lock = threading.Lock()
+
+
+def _cached_config(sha: str):
+    """Return the parsed config file with this blob SHA, or None if it isn't cached."""
+    with _parsed_config_lock:
+        return _parsed_config_cache.get(sha)
+
+
+def _parse_config_blob(content: str, sha: str):
+    """Parse a downloaded config file, reusing the result for a SHA seen before.
+
+    Callers only read the returned structure, which is why it can be shared.
+    """
+    data = _cached_config(sha)
+    if data is not None:
+        return data
+    data = _json_loads(content)
+    with _parsed_config_lock:
+        _parsed_config_cache[sha] = data
+        while len(_parsed_config_cache) > PARSED_CONFIG_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del _parsed_config_cache[next(iter(_parsed_config_cache))]
+    return data
+
+
+class ConfigFetchTask(QRunnable):
+    """Download and parse the repository config files on the global thread pool."""
+    FILES = ('config.json', 'mods.json', 'files.json', 'deletes.json')
+
+    def __init__(self, api: 'GitHubAPI', config_path: str):
+        super().__init__()
+        self.api = api
+        self.config_path = config_path
+        self.signals = ConfigFetchSignals()
+
+    def _list_files(self) -> Optional[Dict[str, str]]:
+        """Map file name -> blob SHA for the config directory, or None if it can't be listed."""
+        try:
+            entries = self.api.list_directory(self.config_path)
+        except Exception:
+            return None  # Fall back to fetching each file by path
+        if not isinstance(entries, list):
+            return None
+        return {entry['name']: entry['sha'] for entry in entries if entry.get('type') == 'file'}
+
+    def _fetch(self, name: str, listing: Optional[Dict[str, str]]):
+        path = f"{self.config_path}/{name}" if self.config_path else name
+        try:
+            if listing is None:
+                content, sha = self.api.get_file(path)
+            else:
+                sha = listing.get(name)
+                if sha is None:
+                    return None, None, None  # Not in the repository
+                data = _cached_config(sha)
+                if data is not None:
+                    return data, sha, None  # Unchanged since it was last parsed
+                content = self.api.get_blob(sha)
+            data = _parse_config_blob(content, sha) if content else None
+            return data, sha, None
+        except Exception as e:
+            return None, None, e
+
+    def run(self):
+        # One directory listing gives every file's blob SHA, so only files that
+        # changed since they were last parsed have to be downloaded
+        listing = self._list_files()
+        # The files are independent, so request them all at once; the wait
+        # is then the slowest round trip rather than the sum of all four
+        with ThreadPoolExecutor(max_workers=len(self.FILES)) as pool:
+            fetched = pool.map(lambda name: self._fetch(name, listing), self.FILES)
+            results = dict(zip(self.FILES, fetched))
+        self.signals.finished.emit(results)
+
 
-    def stop(self):
-        self._running = False
+class ConfigUploadSignals(QObject):
+    """Signals for ConfigUploadTask."""
+    progress = pyqtSignal(int, str)  # index of the file about to be uploaded, its path
+    finished = pyqtSignal(object, object)  # {filename: new sha}, list of error strings
+
+
+class ConfigUploadTask(QRunnable):
+    """Commit prepared config files to the repository on the global thread pool."""
+
+    def __init__(self, api: 'GitHubAPI', changes: List[Tuple[str, bytes, Optional[str]]], message: str):
+        super().__init__()
+        self.api = api
+        self.changes = changes  # (path, content, sha) - content is already serialized
+        self.message = message  # Commit message; may reference {path}
+        self.signals = ConfigUploadSignals()
+
+    def run(self):
+        new_shas = {}
+        errors = []
+        for i, (path, content, sha) in enumerate(self.changes):
+            self.signals.progress.emit(i, path)
+            try:
+                result = self.api.create_or_update_file(
+                    path, content, self.message.format(path=path), sha
+                )
+                new_sha = result.get('content', {}).get('sha')
+                if new_sha:
+                    new_shas[path.split('/')[-1]] = new_sha
+            except Exception as e:
+                errors.append(f"{path}: {str(e)}")
+        self.signals.finished.emit(new_shas, errors)
 
 
 # === Data Models ===
+# Serialized fields of ModEntry/FileEntry: attribute names and their JSON keys, in output order
+_MOD_FIELDS = ('display_name', 'file_name', 'id', 'hash', 'install_location', 'source', 'since')
+_MOD_KEYS = ('display_name', 'file_name', 'id', 'hash', 'installLocation', 'source', 'since')
+_MOD_GET = operator.attrgetter(*_MOD_FIELDS)
+_FILE_FIELDS = ('display_name', 'file_name', 'url', 'download_path', 'hash', 'overwrite', 'extract', 'since')
+_FILE_KEYS = ('display_name', 'file_name', 'url', 'downloadPath', 'hash', 'overwrite', 'extract', 'since')
+_FILE_GET = operator.attrgetter(*_FILE_FIELDS)
+
+
 class ModEntry:
     """Represents a mod entry in mods.json"""
+    __slots__ = (
+        'display_name', 'file_name', 'id', 'hash', 'install_location', 'source',
+        'since', 'icon_path', '_is_new', '_is_from_previous', '_is_pending',
+        '_icon_data', '_icon_url', '_gui_display_name',
+    )
+
     def __init__(self, data: Dict[str, Any] = None):
         if data is None:
             data = {}
-        self.display_name = data.get('display_name', '')
-        self.file_name = data.get('file_name', '')
+        get = data.get  # Bound once; entries are built in bulk when configs load
+        self.display_name = get('display_name', '')
+        self.file_name = get('file_name', '')
         # Support both "id" (new) and "numberId" (legacy) for backward compatibility
-        self.id = data.get('id', data.get('numberId', ''))
-        self.hash = data.get('hash', '')
-        self.install_location = data.get('installLocation', 'mods')
-        self.source = data.get('source', {'type': 'url', 'url': ''})
-        self.since = data.get('since', DEFAULT_VERSION)  # Version this mod was introduced
-        self.icon_path = data.get('icon_path', '')
+        self.id = get('id', get('numberId', ''))
+        self.hash = get('hash', '')
+        self.install_location = get('installLocation', 'mods')
+        self.source = get('source', {'type': 'url', 'url': ''})
+        self.since = get('since', DEFAULT_VERSION)  # Version this mod was introduced
+        self.icon_path = get('icon_path', '')
         self._is_new = not bool(self.id)
-        self._is_from_previous = data.get('_is_from_previous', False)
+        self._is_from_previous = get('_is_from_previous', False)
+        self._is_pending = False
         self._icon_data = None  # Cached icon bytes
+        self._icon_url = ''
+        self._gui_display_name = ''
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            'display_name': self.display_name,
-            'file_name': self.file_name,
-            'id': self.id,  # Use new "id" field
-            'hash': self.hash,
-            'installLocation': self.install_location,
-            'source': self.source,
-            'since': self.since
-        }
-        # Don't include icon_path or internal flags in output
-        return result
+        # Always written as "id" (not legacy "numberId"); icon_path and internal flags are not output
+        return dict(zip(_MOD_KEYS, _MOD_GET(self)))
+
+    def copy(self) -> 'ModEntry':
+        """Same as ModEntry(self.to_dict()) but shares field values instead of rebuilding them."""
+        clone = ModEntry.__new__(ModEntry)
+        for name, value in zip(_MOD_FIELDS, _MOD_GET(self)):
+            setattr(clone, name, value)
+        clone.icon_path = ''
+        clone._is_new = not bool(self.id)
+        clone._is_from_previous = False
+        clone._is_pending = False
+        clone._icon_data = None
+        clone._icon_url = ''
+        clone._gui_display_name = ''
+        return clone
 
     def is_new(self) -> bool:
         return self._is_new
@@ -1251,46 +2100,60 @@ class ModEntry:
 
 class FileEntry:
     """Represents a file entry in files.json"""
+    __slots__ = (
+        'display_name', 'file_name', 'url', 'download_path', 'hash', 'overwrite',
+        'extract', 'since', 'icon_path', '_is_from_previous', '_is_pending',
+        '_gui_display_name',
+    )
+
     def __init__(self, data: Dict[str, Any] = None):
         if data is None:
             data = {}
-        self.display_name = data.get('display_name', '')
-        self.file_name = data.get('file_name', '')
-        self.url = data.get('url', '')
-        self.download_path = data.get('downloadPath', 'config/')
-        self.hash = data.get('hash', '')
-        self.overwrite = data.get('overwrite', True)
-        self.extract = data.get('extract', False)
-        self.since = data.get('since', DEFAULT_VERSION)  # Version this file was introduced
-        self.icon_path = data.get('icon_path', '')
-        self._is_from_previous = data.get('_is_from_previous', False)
+        get = data.get
+        self.display_name = get('display_name', '')
+        self.file_name = get('file_name', '')
+        self.url = get('url', '')
+        self.download_path = get('downloadPath', 'config/')
+        self.hash = get('hash', '')
+        self.overwrite = get('overwrite', True)
+        self.extract = get('extract', False)
+        self.since = get('since', DEFAULT_VERSION)  # Version this file was introduced
+        self.icon_path = get('icon_path', '')
+        self._is_from_previous = get('_is_from_previous', False)
+        self._is_pending = False
+        self._gui_display_name = ''
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            'display_name': self.display_name,
-            'file_name': self.file_name,
-            'url': self.url,
-            'downloadPath': self.download_path,
-            'hash': self.hash,
-            'overwrite': self.overwrite,
-            'extract': self.extract,
-            'since': self.since
-        }
         # Don't include icon_path or internal flags in output
-        return result
+        return dict(zip(_FILE_KEYS, _FILE_GET(self)))
+
+    def copy(self) -> 'FileEntry':
+        """Same as FileEntry(self.to_dict()) but shares field values instead of rebuilding them."""
+        clone = FileEntry.__new__(FileEntry)
+        for name, value in zip(_FILE_FIELDS, _FILE_GET(self)):
+            setattr(clone, name, value)
+        clone.icon_path = ''
+        clone._is_from_previous = False
+        clone._is_pending = False
+        clone._gui_display_name = ''
+        return clone
 
 
 class DeleteEntry:
     """Represents a delete entry in deletes.json"""
+    __slots__ = ('path', 'type', 'reason', 'version', 'icon_path', '_is_unremovable', '_is_pending')
+
     def __init__(self, data: Dict[str, Any] = None):
         if data is None:
             data = {}
-        self.path = data.get('path', '')
-        self.type = data.get('type', 'file')
-        self.reason = data.get('reason', '')
-        self.version = data.get('version', DEFAULT_VERSION)  # Version this deletion applies to
-        self.icon_path = data.get('icon_path', '')
-        self._is_unremovable = data.get('_is_unremovable', False)  # For auto-added deletes from removed mods/files
+        get = data.get
+        self.path = get('path', '')
+        self.type = get('type', 'file')
+        self.reason = get('reason', '')
+        self.version = get('version', DEFAULT_VERSION)  # Version this deletion applies to
+        self.icon_path = get('icon_path', '')
+        self._is_unremovable = get('_is_unremovable', False)  # For auto-added deletes from removed mods/files
+        self._is_pending = False
 
     def to_dict(self) -> Dict[str, Any]:
         result = {
@@ -1366,6 +2229,84 @@ class VersionConfig:
         return self._is_new
 
 
+# === Item Models ===
+class DeleteListModel(QAbstractListModel):
+    """List model that reads DeleteEntry objects directly, no per-row items."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries: List[DeleteEntry] = []
+
+    def set_entries(self, entries: List[DeleteEntry]):
+        """Point the model at a (live) list of delete entries."""
+        self.beginResetModel()
+        self._entries = entries
+        self.endResetModel()
+
+    def entry(self, index: QModelIndex) -> Optional[DeleteEntry]:
+        if not index.isValid() or index.row() >= len(self._entries):
+            return None
+        return self._entries[index.row()]
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        entry = self.entry(index)
+        if entry is None:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{entry.path} ({entry.type})"
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return entry.reason or None
+        return None
+
+
+# === Schema-Driven Forms ===
+# kind -> (widget class, change signal name, getter, setter)
+FORM_WIDGET_KINDS = {
+    'line': (QLineEdit, 'textChanged', QLineEdit.text, QLineEdit.setText),
+    'spin': (QSpinBox, 'valueChanged', QSpinBox.value, QSpinBox.setValue),
+    'check': (QCheckBox, 'stateChanged', QCheckBox.isChecked, QCheckBox.setChecked),
+}
+
+# Advanced options of config.json: (label, ModpackConfig attribute, kind, *args)
+MODPACK_CONFIG_FORM = (
+    ("Check Current Version:", 'check_current_version', 'check'),
+    ("Max Retries:", 'max_retries', 'spin', 1, 10),
+    ("Backups to Keep:", 'backup_keep', 'spin', 1, 20),
+    ("Debug Mode:", 'debug_mode', 'check'),
+)
+
+
+class SchemaForm:
+    """Builds QFormLayout rows from a schema table and maps them to object attributes."""
+
+    def __init__(self, layout: QFormLayout, schema, on_change=None):
+        self.widgets: Dict[str, QWidget] = {}
+        self._accessors = []
+        for label, attr, kind, *args in schema:
+            widget_cls, signal_name, getter, setter = FORM_WIDGET_KINDS[kind]
+            widget = widget_cls()
+            if kind == 'spin':
+                widget.setRange(*args)
+            if on_change is not None:
+                getattr(widget, signal_name).connect(on_change)
+            layout.addRow(label, widget)
+            self.widgets[attr] = widget
+            self._accessors.append((attr, widget, getter, setter))
+
+    def load(self, obj):
+        """Copy attribute values from obj into the widgets."""
+        for attr, widget, _, setter in self._accessors:
+            setter(widget, getattr(obj, attr))
+
+    def save(self, obj):
+        """Copy widget values back onto obj."""
+        for attr, widget, getter, _ in self._accessors:
+            setattr(obj, attr, getter(widget))
+
+
 
 # === Dialogs ===
 class LoadingDialog(QDialog):
@@ -1554,6 +2495,14 @@ class ThemeCreationDialog(QDialog):
             self.theme_data = dict(THEMES[edit_theme_key])
         else:
             self.theme_data = dict(THEMES.get(base_theme_key, THEMES["dark"]))
+
+        # Colour previews are validated/restyled in one batch once typing pauses
+        self._dirty_previews = set()
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(VALIDATION_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self._flush_previews)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -1608,6 +2557,7 @@ class ThemeCreationDialog(QDialog):
         # Color fields
         self.color_edits = {}
         self.color_buttons = {}
+        self.color_previews = {}
         color_labels = {
             'bg_primary': 'Background Primary',
             'bg_secondary': 'Background Secondary',
@@ -1650,6 +2600,7 @@ class ThemeCreationDialog(QDialog):
             preview.setFixedSize(24, 24)
             preview.setStyleSheet(f"background-color: {self.theme_data.get(key, '#000000')}; border: 1px solid #888; border-radius: 4px;")
             preview.setObjectName(f"preview_{key}")
+            self.color_previews[key] = preview
             row.addWidget(preview)
 
             row.addStretch()
@@ -1685,9 +2636,6 @@ class ThemeCreationDialog(QDialog):
 
     def _pick_color(self, key: str):
         """Open a color picker dialog for the specified color key."""
-        from PyQt6.QtWidgets import QColorDialog
-        from PyQt6.QtGui import QColor
-
         current_color = self.theme_data.get(key, '#000000')
         color = QColorDialog.getColor(QColor(current_color), self, f"Select {key} color")
         if color.isValid():
@@ -1710,17 +2658,25 @@ class ThemeCreationDialog(QDialog):
                 self._update_preview(color_key)
 
     def _on_color_changed(self, key: str, text: str):
-        """Update theme data and preview when color changes."""
+        """Update theme data and schedule a (debounced) preview refresh."""
         self.theme_data[key] = text
-        self._update_preview(key)
+        self._dirty_previews.add(key)
+        # Restarting a running single-shot timer resets the countdown
+        self._preview_timer.start()
+
+    def _flush_previews(self):
+        """Validate and restyle every preview touched since the last flush."""
+        for key in self._dirty_previews:
+            self._update_preview(key)
+        self._dirty_previews.clear()
 
     def _update_preview(self, key: str):
         """Update the color preview for a specific key."""
-        preview = self.findChild(QLabel, f"preview_{key}")
+        preview = self.color_previews.get(key)
         if preview:
             color = self.theme_data.get(key, '#000000')
             # Validate color format
-            if re.match(r'^#[0-9A-Fa-f]{6}$', color):
+            if HEX_COLOR_RE.match(color):
                 preview.setStyleSheet(f"background-color: {color}; border: 1px solid #888; border-radius: 4px;")
             else:
                 preview.setStyleSheet("background-color: #ff0000; border: 1px solid #888; border-radius: 4px;")
@@ -1730,7 +2686,7 @@ class ThemeCreationDialog(QDialog):
         name = self.name_edit.text().strip() or "Preview Theme"
         self.theme_data['name'] = name
         # Apply theme temporarily
-        QApplication.instance().setStyleSheet(generate_stylesheet(self.theme_data))
+        apply_stylesheet(self.theme_data)
 
     def _create_theme(self):
         """Create or update the theme and save it."""
@@ -1744,7 +2700,7 @@ class ThemeCreationDialog(QDialog):
             key = self.edit_theme_key
         else:
             # Generate a unique key for the theme
-            key = re.sub(r'[^a-z0-9_]', '_', name.lower())
+            key = THEME_KEY_UNSAFE_RE.sub('_', name.lower())
             key = f"custom_{key}"
             # Check for duplicate names (only for new themes)
             if key in THEMES:
@@ -1754,7 +2710,7 @@ class ThemeCreationDialog(QDialog):
         # Validate all colors
         for color_key, edit in self.color_edits.items():
             color = edit.text().strip()
-            if not re.match(r'^#[0-9A-Fa-f]{6}$', color):
+            if not HEX_COLOR_RE.match(color):
                 self.error_label.setText(f"Invalid color format for {color_key}: {color}")
                 return
 
@@ -1767,15 +2723,19 @@ class ThemeCreationDialog(QDialog):
         if self.edit_theme_key:
             return self.edit_theme_key
         name = self.name_edit.text().strip()
-        return f"custom_{re.sub(r'[^a-z0-9_]', '_', name.lower())}"
+        return f"custom_{THEME_KEY_UNSAFE_RE.sub('_', name.lower())}"
 
 
 class SetupDialog(QDialog):
     """First-time setup dialog for GitHub configuration."""
+    # Connection test results by (repo URL, token): (reachable, time.monotonic() of the test)
+    _test_results: Dict[Tuple[str, str], Tuple[bool, float]] = {}
 
     def __init__(self, parent=None, existing_config: dict = None):
         super().__init__(parent)
         self.config = existing_config or {}
+        self._test_signals: Optional[ConnectionTestSignals] = None  # Of the test in progress
+        self._test_key: Optional[Tuple[str, str]] = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -1860,11 +2820,12 @@ class SetupDialog(QDialog):
 
         layout.addWidget(theme_group)
 
-        test_btn = QPushButton("Test Connection")
-        test_btn.clicked.connect(self.test_connection)
-        layout.addWidget(test_btn)
+        self.test_btn = QPushButton("Test Connection")
+        self.test_btn.clicked.connect(self.test_connection)
+        layout.addWidget(self.test_btn)
 
         self.status_label = QLabel("")
+        self.status_label.setObjectName("setupStatus")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.status_label)
 
@@ -1881,12 +2842,20 @@ class SetupDialog(QDialog):
         button_layout.addWidget(save_btn)
         layout.addLayout(button_layout)
 
+    def _set_status(self, text: str, state: str):
+        """Show text in the status line; its colour comes from the app stylesheet rule for state."""
+        self.status_label.setText(text)
+        if self.status_label.property("state") != state:
+            self.status_label.setProperty("state", state)
+            self.status_label.style().unpolish(self.status_label)
+            self.status_label.style().polish(self.status_label)
+
     def _on_theme_preview(self):
         """Preview theme change in the setup dialog."""
         theme_key = self.theme_combo.currentData()
         if theme_key and theme_key in THEMES:
             set_current_theme(theme_key)
-            QApplication.instance().setStyleSheet(generate_stylesheet(THEMES[theme_key]))
+            apply_stylesheet(THEMES[theme_key])
 
     def show_token_guide(self):
         """Show the API token creation guide."""
@@ -1898,48 +2867,55 @@ class SetupDialog(QDialog):
         token = self.token_edit.text().strip()
 
         if not repo_url:
-            self.status_label.setText("Please enter a repository URL")
-            theme = get_current_theme()
-            self.status_label.setStyleSheet(f"color: {theme['danger']};")
+            self._set_status("Please enter a repository URL", "error")
             return
 
         if not token:
-            self.status_label.setText("API Token is required")
-            theme = get_current_theme()
-            self.status_label.setStyleSheet(f"color: {theme['danger']};")
+            self._set_status("API Token is required", "error")
             return
 
-        self.status_label.setText("Testing connection...")
-        theme = get_current_theme()
-        self.status_label.setStyleSheet(f"color: {theme['warning']};")
-        QApplication.processEvents()
+        # The test only reads the repository, so the branch doesn't affect the result
+        key = (repo_url, token)
+        cached = self._test_results.get(key)
+        if cached is not None:
+            ok, tested_at = cached
+            if time.monotonic() - tested_at < (CONNECTION_TEST_TTL if ok else CONNECTION_TEST_FAILURE_TTL):
+                self._show_test_result(ok)
+                return
 
-        try:
-            api = GitHubAPI(repo_url, token)
-            api.branch = self.branch_edit.text().strip() or "main"
-            if api.test_connection():
-                self.status_label.setText("Connection successful!")
-                theme = get_current_theme()
-                self.status_label.setStyleSheet(f"color: {theme['success']};")
-            else:
-                self.status_label.setText("Could not connect to repository")
-                theme = get_current_theme()
-                self.status_label.setStyleSheet(f"color: {theme['danger']};")
-        except Exception as e:
-            self.status_label.setText(f"Error: {str(e)[:50]}")
-            theme = get_current_theme()
-            self.status_label.setStyleSheet(f"color: {theme['danger']};")
+        self._set_status("Testing connection...", "working")
+        self.test_btn.setEnabled(False)
+
+        task = ConnectionTestTask(repo_url, token)
+        task.signals.finished.connect(self._on_test_finished)
+        self._test_signals = task.signals
+        self._test_key = key
+        QThreadPool.globalInstance().start(task)
+
+    def _on_test_finished(self, ok: bool, error: str):
+        if self.sender() is not self._test_signals:
+            return
+        self._test_signals = None
+        self.test_btn.setEnabled(True)
+        if error:
+            self._set_status(f"Error: {error[:50]}", "error")
+            return
+        self._test_results[self._test_key] = (ok, time.monotonic())
+        self._show_test_result(ok)
+
+    def _show_test_result(self, ok: bool):
+        if ok:
+            self._set_status("Connection successful!", "ok")
+        else:
+            self._set_status("Could not connect to repository", "error")
 
     def validate_and_accept(self):
         """Validate that API token is provided before accepting."""
-        theme = get_current_theme()
         if not self.repo_url_edit.text().strip():
-            self.status_label.setText("Repository URL is required")
-            self.status_label.setStyleSheet(f"color: {theme['danger']};")
+            self._set_status("Repository URL is required", "error")
             return
         if not self.token_edit.text().strip():
-            self.status_label.setText("API Token is required to edit the repository")
-            self.status_label.setStyleSheet(f"color: {theme['danger']};")
+            self._set_status("API Token is required to edit the repository", "error")
             return
         self.accept()
 
@@ -1958,7 +2934,7 @@ class AddVersionDialog(QDialog):
 
     def __init__(self, existing_versions: List[str], parent=None):
         super().__init__(parent)
-        self.existing_versions = existing_versions
+        self.existing_versions = frozenset(existing_versions)
         self.latest_version = self._get_latest_version()
         self.setup_ui()
 
@@ -2068,7 +3044,7 @@ class AddVersionDialog(QDialog):
             self.error_label.setText("Please enter a version number")
             return
         # Only allow X.Y.Z format - no -beta, -rc, etc.
-        if not re.match(r'^\d+\.\d+\.\d+$', version):
+        if not VERSION_RE.match(version):
             self.error_label.setText("Version must be in X.Y.Z format (e.g., 1.0.0)")
             return
         if version in self.existing_versions:
@@ -2089,7 +3065,7 @@ class AddModDialog(QDialog):
 
     def __init__(self, existing_ids: List[str], parent=None):
         super().__init__(parent)
-        self.existing_ids = existing_ids
+        self.existing_ids = frozenset(existing_ids)
         self.custom_icon_path = ""
         self.setup_ui()
 
@@ -2167,9 +3143,9 @@ class AddModDialog(QDialog):
         )
         if file_path:
             self.custom_icon_path = file_path
-            pixmap = QPixmap(file_path)
+            pixmap = load_pixmap(file_path, 60)
             if not pixmap.isNull():
-                self.icon_preview.setPixmap(pixmap.scaled(60, 60, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+                self.icon_preview.setPixmap(pixmap)
 
     def clear_icon(self):
         self.custom_icon_path = ""
@@ -2186,7 +3162,7 @@ class AddModDialog(QDialog):
         if not mod_id:
             self.error_label.setText("Please enter a unique ID")
             return
-        if not re.match(r'^[a-zA-Z0-9_-]+$', mod_id):
+        if not MOD_ID_CHARS.issuperset(mod_id):
             self.error_label.setText("ID can only contain letters, numbers, underscores, and hyphens")
             return
         if mod_id in self.existing_ids:
@@ -2204,12 +3180,23 @@ class AddModDialog(QDialog):
 
 class ConfirmDeleteDialog(QDialog):
     """Dialog for confirming deletion."""
+    # One dialog per parent, kept for reuse; PyQt doesn't hand dialogs over to their parent
+    _instances: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
     def __init__(self, item_name: str, item_type: str = "item", parent=None):
         super().__init__(parent)
-        self.item_name = item_name
-        self.item_type = item_type
         self.setup_ui()
+        self.set_item(item_name, item_type)
+
+    @classmethod
+    def confirm(cls, item_name: str, item_type: str, parent: QWidget) -> bool:
+        """Ask whether to delete item_name, reusing the dialog parent showed before."""
+        dialog = cls._instances.get(parent)
+        if dialog is None:
+            dialog = cls._instances[parent] = cls(item_name, item_type, parent)
+        else:
+            dialog.set_item(item_name, item_type)
+        return bool(dialog.exec())
 
     def setup_ui(self):
         self.setWindowTitle("Confirm Delete")
@@ -2220,14 +3207,12 @@ class ConfirmDeleteDialog(QDialog):
         layout.setSpacing(20)
         layout.setContentsMargins(30, 30, 30, 30)
 
-        header = QLabel("Confirm Delete")
-        theme = get_current_theme()
-        header.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {theme['danger']};")
-        layout.addWidget(header)
+        self.header = QLabel("Confirm Delete")
+        layout.addWidget(self.header)
 
-        message = QLabel(f"Are you sure you want to delete this {self.item_type}?\n\n\"{self.item_name}\"")
-        message.setWordWrap(True)
-        layout.addWidget(message)
+        self.message = QLabel()
+        self.message.setWordWrap(True)
+        layout.addWidget(self.message)
 
         layout.addStretch()
 
@@ -2242,6 +3227,16 @@ class ConfirmDeleteDialog(QDialog):
         button_layout.addWidget(delete_btn)
         layout.addLayout(button_layout)
 
+    def set_item(self, item_name: str, item_type: str = "item"):
+        """Show the dialog for another item."""
+        self.item_name = item_name
+        self.item_type = item_type
+        self.message.setText(f"Are you sure you want to delete this {item_type}?\n\n\"{item_name}\"")
+        # The theme may have changed since the dialog was last shown
+        header_style = f"font-size: 18px; font-weight: bold; color: {get_current_theme()['danger']};"
+        if self.header.styleSheet() != header_style:
+            self.header.setStyleSheet(header_style)
+
 
 class ModSearchThread(QThread):
     """Background thread for searching mods from CurseForge/Modrinth."""
@@ -2302,7 +3297,7 @@ class ModSearchThread(QThread):
 
         req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
         with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read())
+            data = _json_loads(response.read())
             mods = data.get('data', [])
             # Get total count from pagination info
             pagination = data.get('pagination', {})
@@ -2348,7 +3343,7 @@ class ModSearchThread(QThread):
 
         req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
         with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read())
+            data = _json_loads(response.read())
             hits = data.get('hits', [])
             # Get total count from API response
             total_count = data.get('total_hits', 0)
@@ -2404,7 +3399,7 @@ class ModVersionFetchThread(QThread):
 
         req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
         with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read())
+            data = _json_loads(response.read())
             files = data.get('data', [])
 
             results = []
@@ -2425,7 +3420,7 @@ class ModVersionFetchThread(QThread):
 
         req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
         with urllib.request.urlopen(req, timeout=30) as response:
-            versions = json.loads(response.read())
+            versions = _json_loads(response.read())
 
             results = []
             for v in versions[:20]:  # Limit to 20 most recent
@@ -2474,7 +3469,7 @@ class ModDescriptionFetchThread(QThread):
         url = f"{CF_PROXY_BASE_URL}/mods/{self.project_id}/description"
         req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
         with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read())
+            data = _json_loads(response.read())
             description = data.get('data', '')
             # Sanitize HTML by removing potentially dangerous tags/attributes
             # Allow only safe HTML tags for display
@@ -2487,13 +3482,13 @@ class ModDescriptionFetchThread(QThread):
             return html_content
         # Remove script tags completely - match opening tag, content, and closing tag
         # Using a more robust pattern that handles whitespace and attributes in closing tags
-        html_content = re.sub(r'<script\b[^>]*>[\s\S]*?<\s*/\s*script[^>]*>', '', html_content, flags=re.IGNORECASE)
+        html_content = SCRIPT_BLOCK_RE.sub('', html_content)
         # Also remove any remaining standalone script tags
-        html_content = re.sub(r'<\s*/?script\b[^>]*>', '', html_content, flags=re.IGNORECASE)
+        html_content = SCRIPT_TAG_RE.sub('', html_content)
         # Remove event handlers (onclick, onload, etc.)
-        html_content = re.sub(r'\s+on\w+\s*=\s*["\'][^"\']*["\']', '', html_content, flags=re.IGNORECASE)
+        html_content = EVENT_HANDLER_RE.sub('', html_content)
         # Remove javascript: URLs
-        html_content = re.sub(r'href\s*=\s*["\']javascript:[^"\']*["\']', '', html_content, flags=re.IGNORECASE)
+        html_content = JAVASCRIPT_HREF_RE.sub('', html_content)
         return html_content
 
     def _fetch_modrinth_description(self) -> str:
@@ -2501,7 +3496,7 @@ class ModDescriptionFetchThread(QThread):
         url = f"https://api.modrinth.com/v2/project/{self.project_id}"
         req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
         with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read())
+            data = _json_loads(response.read())
             # Modrinth returns body (full description) as markdown
             return data.get('body', data.get('description', ''))
 
@@ -2650,6 +3645,9 @@ class ModBrowserDialog(QDialog):
 
         self.search_in_progress = False
 
+        # Theme the inline styles were built with; a reused dialog is rebuilt if it changes
+        self._theme = get_current_theme()
+
         self.setup_ui()
 
         # Restore session state (source tab and filters)
@@ -2658,6 +3656,25 @@ class ModBrowserDialog(QDialog):
         # Load popular mods on startup
         QTimer.singleShot(100, self.load_popular_mods)
 
+    def reset(self, existing_ids: List[str], current_version: str):
+        """Return a reused dialog to the state of a freshly opened one."""
+        self.existing_ids = existing_ids
+        self.current_version = current_version
+        self.current_page = 0
+        self.selected_mod = None
+        self.selected_version = None
+        self.add_btn.setEnabled(False)
+        self.versions_combo.clear()
+        self.mod_info_header.setText("Select a mod to view its description")
+        self.description_browser.setHtml("")
+
+        self.search_edit.blockSignals(True)  # Don't trigger the debounced auto-search
+        self.search_edit.clear()
+        self.search_edit.blockSignals(False)
+
+        self._restore_session_state()
+        QTimer.singleShot(100, self.load_popular_mods)
+
     def setup_ui(self):
         """Set up the UI for the mod browser dialog with pagination controls."""
         self.setWindowTitle("Browse Mods - CurseForge / Modrinth")
@@ -2766,8 +3783,7 @@ class ModBrowserDialog(QDialog):
 
         self.loader_combo = QComboBox()
         self.loader_combo.setFixedWidth(100)
-        for name in MOD_LOADER_OPTIONS.keys():
-            self.loader_combo.addItem(name)
+        self.loader_combo.setModel(_option_model(MOD_LOADER_OPTIONS))
         self.loader_combo.setCurrentIndex(0)  # Default to "Both"
         self.loader_combo.currentIndexChanged.connect(self._on_filter_changed)
         filter_layout.addWidget(self.loader_combo)
@@ -3202,15 +4218,12 @@ class ModBrowserDialog(QDialog):
     def _update_sort_options(self):
         """Update sort dropdown options based on current source."""
         self.sort_combo.blockSignals(True)
-        self.sort_combo.clear()
 
         source = self._get_selected_source()
         if source == 'curseforge':
-            for name in CURSEFORGE_SORT_OPTIONS.keys():
-                self.sort_combo.addItem(name)
+            self.sort_combo.setModel(_option_model(CURSEFORGE_SORT_OPTIONS))
         else:
-            for name in MODRINTH_SORT_OPTIONS.keys():
-                self.sort_combo.addItem(name)
+            self.sort_combo.setModel(_option_model(MODRINTH_SORT_OPTIONS))
 
         # Default to Downloads (first item)
         self.sort_combo.setCurrentIndex(0)
@@ -3490,22 +4503,23 @@ class ModBrowserDialog(QDialog):
         # Create a placeholder icon for items without cached icons
         placeholder_pixmap = self._create_placeholder_icon()
 
-        for mod in results:
-            item = QListWidgetItem()
-            item.setText(f"{mod['name']}\nby {mod['author']} • {mod['downloads']:,} downloads")
-            item.setData(Qt.ItemDataRole.UserRole, mod)
-
-            # Check if icon is already cached
-            mod_id = mod.get('id', mod.get('slug', ''))
-            if source in self._icon_cache and mod_id in self._icon_cache[source]:
-                # Apply cached icon immediately
-                self._apply_icon_to_item(item, self._icon_cache[source][mod_id])
-            else:
-                # Set placeholder icon while loading
-                if placeholder_pixmap:
-                    item.setIcon(QIcon(placeholder_pixmap))
+        with _bulk_update(self.results_list):
+            for mod in results:
+                item = QListWidgetItem()
+                item.setText(f"{mod['name']}\nby {mod['author']} • {mod['downloads']:,} downloads")
+                item.setData(Qt.ItemDataRole.UserRole, mod)
+
+                # Check if icon is already cached
+                mod_id = mod.get('id', mod.get('slug', ''))
+                if source in self._icon_cache and mod_id in self._icon_cache[source]:
+                    # Apply cached icon immediately
+                    self._apply_icon_to_item(item, self._icon_cache[source][mod_id])
+                else:
+                    # Set placeholder icon while loading
+                    if placeholder_pixmap:
+                        item.setIcon(QIcon(placeholder_pixmap))
 
-            self.results_list.addItem(item)
+                self.results_list.addItem(item)
 
     def _create_placeholder_icon(self) -> Optional[QPixmap]:
         """Create a placeholder icon for items without cached icons."""
@@ -3515,7 +4529,6 @@ class ModBrowserDialog(QDialog):
             pixmap = QPixmap(size, size)
             pixmap.fill(Qt.GlobalColor.transparent)
 
-            from PyQt6.QtGui import QPainter, QFont, QColor
             painter = QPainter(pixmap)
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
@@ -3718,8 +4731,7 @@ class ModBrowserDialog(QDialog):
         """Handle full description fetch."""
         # Check if description is HTML by looking for common HTML tags
         # CurseForge returns HTML, Modrinth returns Markdown
-        html_pattern = r'<\s*(p|div|span|br|img|a|h[1-6]|ul|ol|li|strong|em|b|i)\b'
-        is_html = bool(re.search(html_pattern, description, re.IGNORECASE))
+        is_html = bool(HTML_TAG_RE.search(description))
 
         if is_html:
             self.description_browser.setHtml(description)
@@ -3913,91 +4925,80 @@ class ItemCard(QFrame):
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         # Do not call update_style() here because some widgets (like name_label) are not created yet.
 
-        theme = get_current_theme()
-
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(4)
 
         self.icon_label = QLabel()
+        self.icon_label.setObjectName("cardIcon")
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.icon_label.setFixedSize(56, 56)  # Made icon slightly bigger
 
         if self.is_add_button:
+            # Glyph size and weight come from the addButton rule in the app stylesheet
+            self.setProperty("addButton", True)
             self.icon_label.setText("+")
-            # Use a more visible color that works on both light and dark themes
-            self.icon_label.setStyleSheet(f"font-size: 36px; font-weight: bold; background-color: transparent; color: {theme['text_primary']};")
-        elif self._icon_data:
-            # Load icon from bytes data
-            self._load_icon_from_bytes(self._icon_data)
-            self.icon_label.setStyleSheet("background-color: transparent;")
-        elif self.icon_path and os.path.exists(self.icon_path):
-            pixmap = QPixmap(self.icon_path)
-            if not pixmap.isNull():
-                self.icon_label.setPixmap(pixmap.scaled(56, 56, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-                self.icon_label.setStyleSheet("background-color: transparent;")
-            else:
-                self._set_default_icon()
         else:
-            self._set_default_icon()
+            self._apply_icon()
 
         layout.addWidget(self.icon_label, alignment=Qt.AlignmentFlag.AlignCenter)
 
         self.name_label = QLabel(self.name if not self.is_add_button else "Add")
+        self.name_label.setObjectName("cardName")
         self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.name_label.setWordWrap(True)
-        self.name_label.setStyleSheet(f"font-size: 11px; background-color: transparent; color: {theme['text_primary']};")
         layout.addWidget(self.name_label)
 
-        # Now that the UI elements are created, set the initial style.
+        # Now that the UI elements are created, set the initial style (including the label's).
         self.update_style()
 
+    def _apply_icon(self):
+        """Show the icon from _icon_data or icon_path, falling back to the default icon."""
+        if self._icon_data:
+            # Load icon from bytes data
+            self._load_icon_from_bytes(self._icon_data)
+        elif self.icon_path:
+            pixmap = load_pixmap(self.icon_path, 56)
+            if not pixmap.isNull():
+                self.icon_label.setPixmap(pixmap)
+            else:
+                self._set_default_icon()
+        else:
+            self._set_default_icon()
+
+    def set_content(self, name: str, icon_path: str = "", icon_data: bytes = None):
+        """Show another entry on this card, reusing its widgets."""
+        self.name = name
+        self.name_label.setText(name)
+        if icon_path != self.icon_path or icon_data is not self._icon_data:
+            self.icon_path = icon_path
+            self._icon_data = icon_data
+            self._apply_icon()
+
     def _set_default_icon(self):
         """Set the default package icon."""
-        theme = get_current_theme()
         self.icon_label.setText("📦")
-        self.icon_label.setStyleSheet(f"font-size: 28px; background-color: transparent; color: {theme['text_primary']};")  # Slightly bigger icon
 
     def _load_icon_from_bytes(self, data: bytes):
         """Load icon from bytes data."""
         try:
-            pixmap = QPixmap()
-            if pixmap.loadFromData(data):
-                self.icon_label.setPixmap(pixmap.scaled(56, 56, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-                self.icon_label.setStyleSheet("background-color: transparent;")
+            pixmap = load_pixmap_from_data(data, 56)
+            if not pixmap.isNull():
+                self.icon_label.setPixmap(pixmap)
             else:
                 self._set_default_icon()
         except Exception:
             self._set_default_icon()
 
     def update_style(self):
-        # Use theme colors directly for proper theming
-        theme = get_current_theme()
-        if self.selected:
-            self.setStyleSheet(f"""
-                ItemCard {{
-                    background-color: {theme['accent']};
-                    border: 2px solid {theme['accent']};
-                    border-radius: 8px;
-                }}
-            """)
-            # Update label colors for selected state, if label exists
-            if hasattr(self, "name_label"):
-                self.name_label.setStyleSheet(f"font-size: 11px; background-color: transparent; color: {theme['bg_primary']};")
-        else:
-            self.setStyleSheet(f"""
-                ItemCard {{
-                    background-color: {theme['bg_secondary']};
-                    border: 2px solid {theme['border']};
-                    border-radius: 8px;
-                }}
-                ItemCard:hover {{
-                    border-color: {theme['accent']};
-                }}
-            """)
-            # Update label colors for normal state, if label exists
-            if hasattr(self, "name_label"):
-                self.name_label.setStyleSheet(f"font-size: 11px; background-color: transparent; color: {theme['text_primary']};")
+        # Colours come from the ItemCard rules in the application stylesheet, so a
+        # selection change only re-polishes this card instead of parsing a sheet per card
+        if self.property("selected") == self.selected:
+            return
+        self.setProperty("selected", self.selected)
+        for widget in (self, self.name_label):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
 
     def set_selected(self, selected: bool):
         self.selected = selected
@@ -4081,10 +5082,10 @@ class VersionCard(QFrame):
         if self.is_add_button:
             self.icon_label.setText("+")
             self.icon_label.setStyleSheet(f"font-size: 28px; font-weight: bold; background-color: transparent; color: {theme['text_primary']};")
-        elif self.icon_path and os.path.exists(self.icon_path):
-            pixmap = QPixmap(self.icon_path)
+        elif self.icon_path:
+            pixmap = load_pixmap(self.icon_path, 40)
             if not pixmap.isNull():
-                self.icon_label.setPixmap(pixmap.scaled(40, 40, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+                self.icon_label.setPixmap(pixmap)
                 self.icon_label.setStyleSheet("background-color: transparent;")
             else:
                 self.icon_label.setText("📦")
@@ -4144,7 +5145,42 @@ class ModEditorPanel(QWidget):
         super().__init__(parent)
         self.current_mod: Optional[ModEntry] = None
         self.hash_calculator: Optional[HashCalculator] = None
-        self.setup_ui()
+        self._source_type: Optional[str] = None  # Source type the ID/URL fields are set up for
+        self._loaded_state: Optional[tuple] = None  # _form_state() right after load_mod
+
+        # Field edits are reported once typing pauses, not on every keystroke
+        self._field_change_timer = QTimer(self)
+        self._field_change_timer.setSingleShot(True)
+        self._field_change_timer.setInterval(VALIDATION_DEBOUNCE_MS)
+        self._field_change_timer.timeout.connect(self.on_field_changed)
+
+        # The widgets are built on the first load_mod; many versions are opened
+        # and browsed without ever selecting a mod
+        self._built = False
+        self._editing_enabled = True
+
+    def _ensure_built(self):
+        if not self._built:
+            self._built = True
+            self.setup_ui()
+            self._apply_editing_enabled()
+
+    def set_editing_enabled(self, enabled: bool):
+        """Allow or prevent modifying the mod (for locked versions); viewing and deleting stay possible."""
+        self._editing_enabled = enabled
+        if self._built:
+            self._apply_editing_enabled()
+
+    def _apply_editing_enabled(self):
+        enabled = self._editing_enabled
+        self.save_btn.setEnabled(enabled)
+        # Delete is always enabled (users should be able to delete locked files/old versions)
+        for edit in (self.id_edit, self.hash_edit, self.mod_id_edit, self.file_id_edit, self.url_edit,
+                     self.install_location_edit, self.file_name_edit, self.display_name_edit,
+                     self.info_name_edit):
+            edit.setReadOnly(not enabled)
+        for btn in (self.auto_hash_btn, self.curseforge_btn, self.modrinth_btn, self.url_btn):
+            btn.setEnabled(enabled)
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -4311,15 +5347,12 @@ class ModEditorPanel(QWidget):
         layout.addLayout(btn_layout)
 
         # Connect change signals
-        self.id_edit.textChanged.connect(self.on_field_changed)
-        self.hash_edit.textChanged.connect(self.on_field_changed)
-        self.mod_id_edit.textChanged.connect(self.on_field_changed)
-        self.file_id_edit.textChanged.connect(self.on_field_changed)
-        self.url_edit.textChanged.connect(self.on_field_changed)
-        self.install_location_edit.textChanged.connect(self.on_field_changed)
-        self.file_name_edit.textChanged.connect(self.on_field_changed)
-        self.display_name_edit.textChanged.connect(self.on_field_changed)
-        self.info_name_edit.textChanged.connect(self.on_field_changed)
+        self._field_edits = (
+            self.id_edit, self.hash_edit, self.mod_id_edit, self.file_id_edit, self.url_edit,
+            self.install_location_edit, self.file_name_edit, self.display_name_edit, self.info_name_edit,
+        )
+        for edit in self._field_edits:
+            edit.textChanged.connect(self._field_change_timer.start)
 
     def _update_source_button_styles(self):
         """Update source button styles to show selected state with darker tint."""
@@ -4328,9 +5361,11 @@ class ModEditorPanel(QWidget):
         selected_style = f"background-color: {theme['accent']}; border: 2px solid {theme['accent']}; color: {theme['bg_primary']};"
         normal_style = ""
 
-        self.curseforge_btn.setStyleSheet(selected_style if self.curseforge_btn.isChecked() else normal_style)
-        self.modrinth_btn.setStyleSheet(selected_style if self.modrinth_btn.isChecked() else normal_style)
-        self.url_btn.setStyleSheet(selected_style if self.url_btn.isChecked() else normal_style)
+        for btn in (self.curseforge_btn, self.modrinth_btn, self.url_btn):
+            style = selected_style if btn.isChecked() else normal_style
+            # Loading a mod with the same source type leaves the styles as they are
+            if btn.styleSheet() != style:
+                btn.setStyleSheet(style)
 
     def set_source_type(self, source_type: str):
         self.curseforge_btn.setChecked(source_type == 'curseforge')
@@ -4340,6 +5375,11 @@ class ModEditorPanel(QWidget):
         # Update button styles to show selected state
         self._update_source_button_styles()
 
+        # Clicking through mods of one source type leaves the fields as they are
+        if source_type == self._source_type:
+            return
+        self._source_type = source_type
+
         # Update field visibility
         is_curseforge = source_type == 'curseforge'
         is_modrinth = source_type == 'modrinth'
@@ -4353,59 +5393,59 @@ class ModEditorPanel(QWidget):
         self.file_id_edit.setPlaceholderText("File ID" if is_curseforge else "Version ID" if is_modrinth else "")
 
     def load_mod(self, mod: ModEntry):
+        self._ensure_built()
         self.current_mod = mod
 
-        # Block signals during load
-        self.blockSignals(True)
-
-        self.id_edit.setText(mod.id)
-        self.id_edit.setEnabled(mod.is_new())  # Only editable for new mods
-
-        self.hash_edit.setText(mod.hash)
-        # Display name is used for GUI display under cards
-        # Use mod.id as fallback for display if no display name set
-        gui_display_name = getattr(mod, '_gui_display_name', '') or mod.display_name or mod.id
-        self.display_name_edit.setText(gui_display_name if gui_display_name != mod.id else '')
-        # Info name saves as display_name in config
-        self.info_name_edit.setText(mod.display_name)
-        self.file_name_edit.setText(mod.file_name)
-        self.install_location_edit.setText(mod.install_location or 'mods')
+        # Block signals during load, including the field edits' textChanged
+        with _signals_blocked(self, *self._field_edits):
+            self.id_edit.setText(mod.id)
+            self.id_edit.setEnabled(mod.is_new())  # Only editable for new mods
+
+            self.hash_edit.setText(mod.hash)
+            # Display name is used for GUI display under cards
+            # Use mod.id as fallback for display if no display name set
+            gui_display_name = getattr(mod, '_gui_display_name', '') or mod.display_name or mod.id
+            self.display_name_edit.setText(gui_display_name if gui_display_name != mod.id else '')
+            # Info name saves as display_name in config
+            self.info_name_edit.setText(mod.display_name)
+            self.file_name_edit.setText(mod.file_name)
+            self.install_location_edit.setText(mod.install_location or 'mods')
+
+            # Load source
+            source = mod.source
+            source_type = source.get('type', 'url')
+            self.set_source_type(source_type)
 
-        # Load source
-        source = mod.source
-        source_type = source.get('type', 'url')
-        self.set_source_type(source_type)
-
-        if source_type == 'curseforge':
-            self.mod_id_edit.setText(str(source.get('projectId', '')))
-            self.file_id_edit.setText(str(source.get('fileId', '')))
-            self.url_edit.clear()
-        elif source_type == 'modrinth':
-            self.mod_id_edit.setText(source.get('projectSlug', ''))
-            self.file_id_edit.setText(source.get('versionId', ''))
-            self.url_edit.clear()
-        else:
-            self.mod_id_edit.clear()
-            self.file_id_edit.clear()
-            self.url_edit.setText(source.get('url', ''))
+            if source_type == 'curseforge':
+                self.mod_id_edit.setText(str(source.get('projectId', '')))
+                self.file_id_edit.setText(str(source.get('fileId', '')))
+                self.url_edit.clear()
+            elif source_type == 'modrinth':
+                self.mod_id_edit.setText(source.get('projectSlug', ''))
+                self.file_id_edit.setText(source.get('versionId', ''))
+                self.url_edit.clear()
+            else:
+                self.mod_id_edit.clear()
+                self.file_id_edit.clear()
+                self.url_edit.setText(source.get('url', ''))
 
-        # Hide auto-fill hash button for mods from Find and Add (curseforge/modrinth sources)
-        # because hash is automatically calculated for these mods
-        is_from_api_source = source_type in ['curseforge', 'modrinth']
-        self.auto_hash_btn.setVisible(not is_from_api_source)
+            # Hide auto-fill hash button for mods from Find and Add (curseforge/modrinth sources)
+            # because hash is automatically calculated for these mods
+            is_from_api_source = source_type in ['curseforge', 'modrinth']
+            self.auto_hash_btn.setVisible(not is_from_api_source)
 
-        # Make hash field read-only for API sources (hash is auto-calculated)
-        # For URL sources, hash can still be edited if needed
-        self.hash_edit.setReadOnly(is_from_api_source)
+            # Make hash field read-only for API sources (hash is auto-calculated)
+            # For URL sources, hash can still be edited if needed
+            self.hash_edit.setReadOnly(is_from_api_source)
 
-        # Load icon preview
-        self._update_icon_preview()
+            # Load icon preview
+            self._update_icon_preview()
 
-        # If mod has icon URL but no icon data, try to fetch it
-        if hasattr(mod, '_icon_url') and mod._icon_url and not mod._icon_data:
-            self.fetch_source_icon()
+            # If mod has icon URL but no icon data, try to fetch it
+            if hasattr(mod, '_icon_url') and mod._icon_url and not mod._icon_data:
+                self.fetch_source_icon()
 
-        self.blockSignals(False)
+        self._loaded_state = self._form_state()
 
         # Auto-fill hash if from curseforge/modrinth and no hash is set
         # Use short delay to allow UI to update first before starting the hash calculation
@@ -4416,16 +5456,16 @@ class ModEditorPanel(QWidget):
         """Update the icon preview label."""
         theme = get_current_theme()
         if self.current_mod and self.current_mod._icon_data:
-            pixmap = QPixmap()
-            if pixmap.loadFromData(self.current_mod._icon_data):
-                self.icon_preview.setPixmap(pixmap.scaled(60, 60, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            pixmap = load_pixmap_from_data(self.current_mod._icon_data, 60)
+            if not pixmap.isNull():
+                self.icon_preview.setPixmap(pixmap)
                 self.icon_preview.setStyleSheet(f"border: 2px solid {theme['accent']}; border-radius: 8px;")
             else:
                 self._set_no_icon()
-        elif self.current_mod and self.current_mod.icon_path and os.path.exists(self.current_mod.icon_path):
-            pixmap = QPixmap(self.current_mod.icon_path)
+        elif self.current_mod and self.current_mod.icon_path:
+            pixmap = load_pixmap(self.current_mod.icon_path, 60)
             if not pixmap.isNull():
-                self.icon_preview.setPixmap(pixmap.scaled(60, 60, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+                self.icon_preview.setPixmap(pixmap)
                 self.icon_preview.setStyleSheet(f"border: 2px solid {theme['accent']}; border-radius: 8px;")
             else:
                 self._set_no_icon()
@@ -4472,7 +5512,7 @@ class ModEditorPanel(QWidget):
                         url = f"{CF_PROXY_BASE_URL}/mods/{project_id}"
                         req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
                         with urllib.request.urlopen(req, timeout=10) as response:
-                            data = json.loads(response.read())
+                            data = _json_loads(response.read())
                             mod_data = data.get('data', data)
                             logo = mod_data.get('logo', {})
                             icon_url = logo.get('thumbnailUrl', logo.get('url', ''))
@@ -4486,7 +5526,7 @@ class ModEditorPanel(QWidget):
                         url = f"https://api.modrinth.com/v2/project/{project_slug}"
                         req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
                         with urllib.request.urlopen(req, timeout=10) as response:
-                            data = json.loads(response.read())
+                            data = _json_loads(response.read())
                             icon_url = data.get('icon_url', '')
                     except Exception as e:
                         QMessageBox.warning(self, "Error", f"Failed to fetch icon from Modrinth: {e}")
@@ -4515,10 +5555,19 @@ class ModEditorPanel(QWidget):
             self._update_icon_preview()
             self.icon_changed.emit()
 
+    def _form_state(self) -> tuple:
+        return tuple(edit.text() for edit in self._field_edits) + (self._source_type,)
+
     def save_changes(self):
         if not self.current_mod:
             return
 
+        # Saving an untouched form only closes the editor; nothing is marked modified
+        if self._form_state() == self._loaded_state:
+            self.current_mod.mark_saved()
+            self.mod_saved.emit()
+            return
+
         self.current_mod.id = self.id_edit.text().strip()
         self.current_mod.hash = self.hash_edit.text().strip()
         # Info name saves to display_name in config
@@ -4532,8 +5581,8 @@ class ModEditorPanel(QWidget):
         if self.curseforge_btn.isChecked():
             self.current_mod.source = {
                 'type': 'curseforge',
-                'projectId': int(self.mod_id_edit.text()) if self.mod_id_edit.text().isdigit() else 0,
-                'fileId': int(self.file_id_edit.text()) if self.file_id_edit.text().isdigit() else 0
+                'projectId': _parse_id(self.mod_id_edit.text()),
+                'fileId': _parse_id(self.file_id_edit.text())
             }
         elif self.modrinth_btn.isChecked():
             self.current_mod.source = {
@@ -4548,6 +5597,7 @@ class ModEditorPanel(QWidget):
             }
 
         self.current_mod.mark_saved()
+        self._loaded_state = self._form_state()
         self.mod_changed.emit()
         self.mod_saved.emit()  # Signal to close the editor panel
 
@@ -4574,7 +5624,7 @@ class ModEditorPanel(QWidget):
                     "User-Agent": USER_AGENT
                 })
                 with urllib.request.urlopen(req, timeout=30) as response:
-                    data = json.loads(response.read())
+                    data = _json_loads(response.read())
                     # Handle both direct response and nested data response
                     file_data = data.get('data', data)
                     url = file_data.get('downloadUrl')
@@ -4594,7 +5644,7 @@ class ModEditorPanel(QWidget):
                 api_url = f"https://api.modrinth.com/v2/version/{version_id}"
                 req = urllib.request.Request(api_url, headers={"User-Agent": USER_AGENT})
                 with urllib.request.urlopen(req, timeout=30) as response:
-                    data = json.loads(response.read())
+                    data = _json_loads(response.read())
                     files = data.get('files', [])
                     if files:
                         url = files[0].get('url')
@@ -4613,18 +5663,28 @@ class ModEditorPanel(QWidget):
         self.auto_hash_btn.setEnabled(False)
 
         self.hash_calculator = HashCalculator(url)
-        self.hash_calculator.hash_calculated.connect(self.on_hash_calculated)
-        self.hash_calculator.progress_updated.connect(self.hash_progress.setValue)
-        self.hash_calculator.error_occurred.connect(self.on_hash_error)
-        self.hash_calculator.finished.connect(self.hash_calculator.deleteLater)
-        self.hash_calculator.start()
+        signals = self.hash_calculator.signals
+        signals.hash_calculated.connect(self.on_hash_calculated)
+        signals.progress_updated.connect(self.hash_progress.setValue)
+        signals.error_occurred.connect(self.on_hash_error)
+        QThreadPool.globalInstance().start(self.hash_calculator)
+
+    def _is_current_hash(self) -> bool:
+        """Whether the sending calculator is this panel's current one, not one stopped by clear()."""
+        return self.hash_calculator is not None and self.sender() is self.hash_calculator.signals
 
     def on_hash_calculated(self, hash_value: str):
+        if not self._is_current_hash():
+            return
+        self.hash_calculator = None
         self.hash_edit.setText(hash_value)
         self.hash_progress.setVisible(False)
         self.auto_hash_btn.setEnabled(True)
 
     def on_hash_error(self, error: str):
+        if not self._is_current_hash():
+            return
+        self.hash_calculator = None
         error_msg = f"Failed to calculate hash:\n{error}"
         # Add helpful hint for common CurseForge errors
         if "400" in error or "403" in error:
@@ -4639,26 +5699,21 @@ class ModEditorPanel(QWidget):
 
     def request_delete(self):
         if self.current_mod:
-            dialog = ConfirmDeleteDialog(self.current_mod.display_name or self.current_mod.id, "mod", self)
-            if dialog.exec():
+            if ConfirmDeleteDialog.confirm(self.current_mod.display_name or self.current_mod.id, "mod", self):
                 self.mod_deleted.emit(self.current_mod)
 
     def clear(self):
         # Stop any running hash calculation
         if self.hash_calculator is not None:
-            try:
-                if self.hash_calculator.isRunning():
-                    self.hash_calculator.stop()
-                    self.hash_calculator.wait(1000)
-            except RuntimeError:
-                # Handle case where Qt C++ object was deleted
-                pass
+            self.hash_calculator.stop()
             self.hash_calculator = None
+        self.current_mod = None
+        if not self._built:
+            return
         self.hash_progress.setVisible(False)
         self.auto_hash_btn.setEnabled(True)
         self.auto_hash_btn.setVisible(True)  # Reset visibility for next mod
         self.hash_edit.setReadOnly(True)  # Hash is always read-only, calculated via button or auto
-        self.current_mod = None
         self.id_edit.clear()
         self.hash_edit.clear()
         self.display_name_edit.clear()
@@ -4669,6 +5724,7 @@ class ModEditorPanel(QWidget):
         self.file_id_edit.clear()
         self.url_edit.clear()
         self.set_source_type('url')
+        self._field_change_timer.stop()
 
 
 
@@ -4683,7 +5739,31 @@ class FileEditorPanel(QWidget):
         super().__init__(parent)
         self.current_file: Optional[FileEntry] = None
         self.hash_calculator: Optional[HashCalculator] = None
-        self.setup_ui()
+        self._loaded_state: Optional[tuple] = None  # _form_state() right after load_file
+        # The widgets are built on the first load_file, like ModEditorPanel's
+        self._built = False
+        self._editing_enabled = True
+
+    def _ensure_built(self):
+        if not self._built:
+            self._built = True
+            self.setup_ui()
+            self._apply_editing_enabled()
+
+    def set_editing_enabled(self, enabled: bool):
+        """Allow or prevent modifying the file (for locked versions); viewing and deleting stay possible."""
+        self._editing_enabled = enabled
+        if self._built:
+            self._apply_editing_enabled()
+
+    def _apply_editing_enabled(self):
+        enabled = self._editing_enabled
+        self.save_btn.setEnabled(enabled)
+        for edit in (self.info_name_edit, self.display_name_edit, self.file_name_edit,
+                     self.url_edit, self.download_path_edit, self.hash_edit):
+            edit.setReadOnly(not enabled)
+        for widget in (self.overwrite_check, self.extract_check, self.auto_hash_btn):
+            widget.setEnabled(enabled)
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -4786,6 +5866,7 @@ class FileEditorPanel(QWidget):
         layout.addLayout(btn_layout)
 
     def load_file(self, file_entry: FileEntry):
+        self._ensure_built()
         self.current_file = file_entry
         # Info name saves to display_name in config
         self.info_name_edit.setText(file_entry.display_name)
@@ -4798,10 +5879,21 @@ class FileEditorPanel(QWidget):
         self.hash_edit.setText(file_entry.hash)
         self.overwrite_check.setChecked(file_entry.overwrite)
         self.extract_check.setChecked(file_entry.extract)
+        self._loaded_state = self._form_state()
+
+    def _form_state(self) -> tuple:
+        edits = (self.info_name_edit, self.display_name_edit, self.file_name_edit,
+                 self.url_edit, self.download_path_edit, self.hash_edit)
+        return tuple(edit.text() for edit in edits) + (
+            self.overwrite_check.isChecked(), self.extract_check.isChecked())
 
     def save_changes(self):
         if not self.current_file:
             return
+        # Saving an untouched form only closes the editor; nothing is marked modified
+        if self._form_state() == self._loaded_state:
+            self.file_saved.emit()
+            return
         # Info name saves to display_name in config
         self.current_file.display_name = self.info_name_edit.text().strip()
         # Store GUI display name separately (not saved to config)
@@ -4812,6 +5904,7 @@ class FileEditorPanel(QWidget):
         self.current_file.hash = self.hash_edit.text().strip()
         self.current_file.overwrite = self.overwrite_check.isChecked()
         self.current_file.extract = self.extract_check.isChecked()
+        self._loaded_state = self._form_state()
         self.file_changed.emit()
         self.file_saved.emit()  # Signal to close the editor panel
 
@@ -4839,18 +5932,28 @@ class FileEditorPanel(QWidget):
         self.auto_hash_btn.setEnabled(False)
 
         self.hash_calculator = HashCalculator(url)
-        self.hash_calculator.hash_calculated.connect(self.on_hash_calculated)
-        self.hash_calculator.progress_updated.connect(self.hash_progress.setValue)
-        self.hash_calculator.error_occurred.connect(self.on_hash_error)
-        self.hash_calculator.finished.connect(self.hash_calculator.deleteLater)
-        self.hash_calculator.start()
+        signals = self.hash_calculator.signals
+        signals.hash_calculated.connect(self.on_hash_calculated)
+        signals.progress_updated.connect(self.hash_progress.setValue)
+        signals.error_occurred.connect(self.on_hash_error)
+        QThreadPool.globalInstance().start(self.hash_calculator)
+
+    def _is_current_hash(self) -> bool:
+        """Whether the sending calculator is this panel's current one, not one stopped by clear()."""
+        return self.hash_calculator is not None and self.sender() is self.hash_calculator.signals
 
     def on_hash_calculated(self, hash_value: str):
+        if not self._is_current_hash():
+            return
+        self.hash_calculator = None
         self.hash_edit.setText(hash_value)
         self.hash_progress.setVisible(False)
         self.auto_hash_btn.setEnabled(True)
 
     def on_hash_error(self, error: str):
+        if not self._is_current_hash():
+            return
+        self.hash_calculator = None
         error_msg = f"Failed to calculate hash:\n{error}"
         # Add helpful hint for common CurseForge errors
         if "400" in error or "403" in error:
@@ -4862,24 +5965,19 @@ class FileEditorPanel(QWidget):
 
     def request_delete(self):
         if self.current_file:
-            dialog = ConfirmDeleteDialog(self.current_file.display_name, "file", self)
-            if dialog.exec():
+            if ConfirmDeleteDialog.confirm(self.current_file.display_name, "file", self):
                 self.file_deleted.emit(self.current_file)
 
     def clear(self):
         # Stop any running hash calculation
         if self.hash_calculator is not None:
-            try:
-                if self.hash_calculator.isRunning():
-                    self.hash_calculator.stop()
-                    self.hash_calculator.wait(1000)
-            except RuntimeError:
-                # Handle case where Qt C++ object was deleted
-                pass
+            self.hash_calculator.stop()
             self.hash_calculator = None
+        self.current_file = None
+        if not self._built:
+            return
         self.hash_progress.setVisible(False)
         self.auto_hash_btn.setEnabled(True)
-        self.current_file = None
         self.info_name_edit.clear()
         self.display_name_edit.clear()
         self.file_name_edit.clear()
@@ -4916,7 +6014,7 @@ class DeleteEditorPanel(QWidget):
         info_layout.addRow("Path:", self.path_edit)
 
         self.type_combo = QComboBox()
-        self.type_combo.addItems(['file', 'folder'])
+        self.type_combo.setModel(_option_model(('file', 'folder')))
         info_layout.addRow("Type:", self.type_combo)
 
         self.reason_edit = QLineEdit()
@@ -4963,8 +6061,7 @@ class DeleteEditorPanel(QWidget):
             if self.current_delete._is_unremovable:
                 QMessageBox.warning(self, "Cannot Delete", "This entry was auto-added from a removed mod/file and cannot be deleted.")
                 return
-            dialog = ConfirmDeleteDialog(self.current_delete.path, "delete entry", self)
-            if dialog.exec():
+            if ConfirmDeleteDialog.confirm(self.current_delete.path, "delete entry", self):
                 self.delete_entry_deleted.emit(self.current_delete)
 
     def clear(self):
@@ -5000,8 +6097,13 @@ class VersionEditorPage(QWidget):
         self._pending_delete: Optional[DeleteEntry] = None
         # Track which mod icons have been loaded (for lazy loading)
         self._icons_loaded_count = 0
-        self._icon_load_threads: List[QThread] = []
+        # Icon fetches for the open version report through _icon_signals; setting
+        # _icon_cancel abandons them when another version is loaded
+        self._icon_signals = ModIconSignals()
+        self._icon_signals.icon_fetched.connect(self._on_icon_task_done)
+        self._icon_cancel = threading.Event()
         self._remaining_icons_loaded = False  # Whether all remaining icons have been loaded
+        self._mod_browser: Optional[ModBrowserDialog] = None  # Built on first use, then reused
         self.setup_ui()
 
     def setup_ui(self):
@@ -5065,181 +6167,108 @@ class VersionEditorPage(QWidget):
 
         main_layout.addWidget(self.tabs)
 
-        # Refresh panel styles to ensure they match the current theme
-        # This is important because panels are created before theme is fully applied
-        QTimer.singleShot(0, self.refresh_editor_panels_style)
-
-    def setup_mods_tab(self):
-        layout = QHBoxLayout(self.mods_tab)
-        layout.setContentsMargins(0, 0, 0, 0)
+    def _build_card_grid(self):
+        """Build a left panel holding a scrollable grid of item cards.
 
-        # Left: Grid of mods
+        Returns (left_panel, scroll, grid_widget, grid).
+        """
         left_panel = QWidget()
         left_layout = QVBoxLayout(left_panel)
         left_layout.setContentsMargins(16, 16, 8, 16)
 
-        self.mods_scroll = QScrollArea()
-        self.mods_scroll.setWidgetResizable(True)
-        self.mods_scroll.setFrameShape(QFrame.Shape.NoFrame)
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setFrameShape(QFrame.Shape.NoFrame)
+
+        grid_widget = QWidget()
+        grid = QGridLayout(grid_widget)
+        grid.setSpacing(8)  # Reduced spacing
+        scroll.setWidget(grid_widget)
 
-        self.mods_grid_widget = QWidget()
-        self.mods_grid = QGridLayout(self.mods_grid_widget)
-        self.mods_grid.setSpacing(8)  # Reduced spacing
-        self.mods_scroll.setWidget(self.mods_grid_widget)
+        left_layout.addWidget(scroll)
+        return left_panel, scroll, grid_widget, grid
 
-        left_layout.addWidget(self.mods_scroll)
+    def _build_editor_tab(self, tab: QWidget, left_panel: QWidget, editor: QWidget, left_size: int = 400):
+        """Lay out tab as left_panel beside a placeholder/editor stack.
+
+        Returns (right_container, right_stack, placeholder).
+        """
+        layout = QHBoxLayout(tab)
+        layout.setContentsMargins(0, 0, 0, 0)
 
         # Right: Stacked widget for editor panel and placeholder
         # Wrap in a container with distinct styling
-        self.mod_right_container = QFrame()
-        theme = get_current_theme()
-        self.mod_right_container.setStyleSheet(f"""
-            QFrame {{
-                background-color: {theme['bg_secondary']};
-                border: none;
-                border-radius: 8px;
-                margin: 4px;
-            }}
-            QScrollBar:vertical {{
-                background-color: {theme['bg_secondary']};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {theme['border']};
-                border-radius: 4px;
-                min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {theme['accent']};
-            }}
-        """)
-        mod_right_container_layout = QVBoxLayout(self.mod_right_container)
-        mod_right_container_layout.setContentsMargins(8, 8, 8, 8)
+        right_container = QFrame()
+        right_container.setObjectName("editorContainer")
+        right_container_layout = QVBoxLayout(right_container)
+        right_container_layout.setContentsMargins(8, 8, 8, 8)
 
-        self.mod_right_stack = QStackedWidget()
+        right_stack = QStackedWidget()
 
-        # Placeholder for when no mod is selected
-        self.mod_placeholder = QWidget()
-        placeholder_layout = QVBoxLayout(self.mod_placeholder)
+        # Placeholder for when nothing is selected
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
         placeholder_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         placeholder_layout.setContentsMargins(20, 20, 20, 20)
         placeholder_label = QLabel("No option selected")
-        placeholder_label.setStyleSheet(f"color: {theme['text_secondary']}; font-size: 16px; font-style: italic; background-color: transparent; padding: 16px;")
+        placeholder_label.setObjectName("placeholderLabel")
         placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         placeholder_layout.addWidget(placeholder_label)
-        self.mod_right_stack.addWidget(self.mod_placeholder)
+        right_stack.addWidget(placeholder)
 
-        # Editor panel
-        self.mod_editor = ModEditorPanel()
-        self.mod_editor.mod_changed.connect(self.on_mod_changed)
-        self.mod_editor.mod_saved.connect(self.on_mod_saved)
-        self.mod_editor.mod_deleted.connect(self.on_mod_deleted)
-        self.mod_right_stack.addWidget(self.mod_editor)
+        right_stack.addWidget(editor)
 
         # Show placeholder by default
-        self.mod_right_stack.setCurrentWidget(self.mod_placeholder)
+        right_stack.setCurrentWidget(placeholder)
 
-        mod_right_container_layout.addWidget(self.mod_right_stack)
+        right_container_layout.addWidget(right_stack)
 
         splitter = QSplitter(Qt.Orientation.Horizontal)
         splitter.addWidget(left_panel)
-        splitter.addWidget(self.mod_right_container)
-        splitter.setSizes([400, 400])
+        splitter.addWidget(right_container)
+        splitter.setSizes([left_size, 400])
 
         layout.addWidget(splitter)
+        return right_container, right_stack, placeholder
 
-    def setup_files_tab(self):
-        layout = QHBoxLayout(self.files_tab)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        # Left: Grid of files
-        left_panel = QWidget()
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setContentsMargins(16, 16, 8, 16)
-
-        self.files_scroll = QScrollArea()
-        self.files_scroll.setWidgetResizable(True)
-        self.files_scroll.setFrameShape(QFrame.Shape.NoFrame)
-
-        self.files_grid_widget = QWidget()
-        self.files_grid = QGridLayout(self.files_grid_widget)
-        self.files_grid.setSpacing(8)  # Reduced spacing
-        self.files_scroll.setWidget(self.files_grid_widget)
-
-        left_layout.addWidget(self.files_scroll)
+    def setup_mods_tab(self):
+        # Left: Grid of mods
+        left_panel, self.mods_scroll, self.mods_grid_widget, self.mods_grid = self._build_card_grid()
 
-        # Right: Stacked widget for editor panel and placeholder
-        # Wrap in a container with distinct styling
-        self.file_right_container = QFrame()
-        theme = get_current_theme()
-        self.file_right_container.setStyleSheet(f"""
-            QFrame {{
-                background-color: {theme['bg_secondary']};
-                border: none;
-                border-radius: 8px;
-                margin: 4px;
-            }}
-            QScrollBar:vertical {{
-                background-color: {theme['bg_secondary']};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {theme['border']};
-                border-radius: 4px;
-                min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {theme['accent']};
-            }}
-        """)
-        file_right_container_layout = QVBoxLayout(self.file_right_container)
-        file_right_container_layout.setContentsMargins(8, 8, 8, 8)
+        # Editor panel
+        self.mod_editor = ModEditorPanel()
+        self.mod_editor.mod_changed.connect(self.on_mod_changed)
+        self.mod_editor.mod_saved.connect(self.on_mod_saved)
+        self.mod_editor.mod_deleted.connect(self.on_mod_deleted)
 
-        self.file_right_stack = QStackedWidget()
+        self.mod_right_container, self.mod_right_stack, self.mod_placeholder = self._build_editor_tab(
+            self.mods_tab, left_panel, self.mod_editor
+        )
 
-        # Placeholder for when no file is selected
-        self.file_placeholder = QWidget()
-        placeholder_layout = QVBoxLayout(self.file_placeholder)
-        placeholder_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        placeholder_layout.setContentsMargins(20, 20, 20, 20)
-        placeholder_label = QLabel("No option selected")
-        placeholder_label.setStyleSheet(f"color: {theme['text_secondary']}; font-size: 16px; font-style: italic; background-color: transparent; padding: 16px;")
-        placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        placeholder_layout.addWidget(placeholder_label)
-        self.file_right_stack.addWidget(self.file_placeholder)
+    def setup_files_tab(self):
+        # Left: Grid of files
+        left_panel, self.files_scroll, self.files_grid_widget, self.files_grid = self._build_card_grid()
 
         # Editor panel
         self.file_editor = FileEditorPanel()
         self.file_editor.file_changed.connect(self.on_file_changed)
         self.file_editor.file_saved.connect(self.on_file_saved)
         self.file_editor.file_deleted.connect(self.on_file_deleted)
-        self.file_right_stack.addWidget(self.file_editor)
-
-        # Show placeholder by default
-        self.file_right_stack.setCurrentWidget(self.file_placeholder)
-
-        file_right_container_layout.addWidget(self.file_right_stack)
-
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        splitter.addWidget(left_panel)
-        splitter.addWidget(self.file_right_container)
-        splitter.setSizes([400, 400])
 
-        layout.addWidget(splitter)
+        self.file_right_container, self.file_right_stack, self.file_placeholder = self._build_editor_tab(
+            self.files_tab, left_panel, self.file_editor
+        )
 
     def setup_delete_tab(self):
-        layout = QHBoxLayout(self.delete_tab)
-        layout.setContentsMargins(0, 0, 0, 0)
-
         # Left: List of deletes
         left_panel = QWidget()
         left_layout = QVBoxLayout(left_panel)
         left_layout.setContentsMargins(16, 16, 8, 16)
 
-        self.deletes_list = QListWidget()
-        self.deletes_list.itemClicked.connect(self.on_delete_selected)
+        self.deletes_model = DeleteListModel(self)
+        self.deletes_list = QListView()
+        self.deletes_list.setModel(self.deletes_model)
+        self.deletes_list.clicked.connect(self.on_delete_selected)
         left_layout.addWidget(self.deletes_list)
 
         add_delete_btn = QPushButton("+ Add Delete Entry")
@@ -5247,65 +6276,15 @@ class VersionEditorPage(QWidget):
         add_delete_btn.clicked.connect(self.add_delete)
         left_layout.addWidget(add_delete_btn)
 
-        # Right: Stacked widget for editor panel and placeholder
-        # Wrap in a container with distinct styling
-        self.delete_right_container = QFrame()
-        theme = get_current_theme()
-        self.delete_right_container.setStyleSheet(f"""
-            QFrame {{
-                background-color: {theme['bg_secondary']};
-                border: none;
-                border-radius: 8px;
-                margin: 4px;
-            }}
-            QScrollBar:vertical {{
-                background-color: {theme['bg_secondary']};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {theme['border']};
-                border-radius: 4px;
-                min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {theme['accent']};
-            }}
-        """)
-        delete_right_container_layout = QVBoxLayout(self.delete_right_container)
-        delete_right_container_layout.setContentsMargins(8, 8, 8, 8)
-
-        self.delete_right_stack = QStackedWidget()
-
-        # Placeholder for when no delete entry is selected
-        self.delete_placeholder = QWidget()
-        placeholder_layout = QVBoxLayout(self.delete_placeholder)
-        placeholder_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        placeholder_layout.setContentsMargins(20, 20, 20, 20)
-        placeholder_label = QLabel("No option selected")
-        placeholder_label.setStyleSheet(f"color: {theme['text_secondary']}; font-size: 16px; font-style: italic; background-color: transparent; padding: 16px;")
-        placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        placeholder_layout.addWidget(placeholder_label)
-        self.delete_right_stack.addWidget(self.delete_placeholder)
-
         # Editor panel
         self.delete_editor = DeleteEditorPanel()
         self.delete_editor.delete_changed.connect(self.on_delete_changed)
         self.delete_editor.delete_saved.connect(self.on_delete_entry_saved)
         self.delete_editor.delete_entry_deleted.connect(self.on_delete_entry_deleted)
-        self.delete_right_stack.addWidget(self.delete_editor)
-
-        # Show placeholder by default
-        self.delete_right_stack.setCurrentWidget(self.delete_placeholder)
 
-        delete_right_container_layout.addWidget(self.delete_right_stack)
-
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        splitter.addWidget(left_panel)
-        splitter.addWidget(self.delete_right_container)
-        splitter.setSizes([300, 400])
-
-        layout.addWidget(splitter)
+        self.delete_right_container, self.delete_right_stack, self.delete_placeholder = self._build_editor_tab(
+            self.delete_tab, left_panel, self.delete_editor, left_size=300
+        )
 
     def setup_settings_tab(self):
         layout = QVBoxLayout(self.settings_tab)
@@ -5372,8 +6351,21 @@ class VersionEditorPage(QWidget):
         # Reset icon loading state
         self._icons_loaded_count = 0
         self._remaining_icons_loaded = False
-        self._cancel_icon_load_threads()
+        self._cancel_icon_loads()
+
+        # Hold repaints for the whole page so the three views, the cleared
+        # editors and the lock state show up together in one paint.
+        self.setUpdatesEnabled(False)
+        try:
+            self._load_version_views(version_config)
+        finally:
+            self.setUpdatesEnabled(True)
+
+        # Start loading the first 8 mod icons
+        QTimer.singleShot(50, self._load_initial_icons)
 
+    def _load_version_views(self, version_config: VersionConfig):
+        """Populate the tabs and editor state for version_config."""
         self.refresh_mods_grid()
         self.refresh_files_grid()
         self.refresh_deletes_list()
@@ -5415,13 +6407,10 @@ class VersionEditorPage(QWidget):
             self.tabs.setCurrentIndex(0)  # Mods tab
 
         # Load version icon
-        if version_config.icon_path and os.path.exists(version_config.icon_path):
-            pixmap = QPixmap(version_config.icon_path)
+        if version_config.icon_path:
+            pixmap = load_pixmap(version_config.icon_path, 60)
             if not pixmap.isNull():
-                self.version_icon_preview.setPixmap(pixmap.scaled(60, 60, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-
-        # Start loading the first 8 mod icons
-        QTimer.singleShot(50, self._load_initial_icons)
+                self.version_icon_preview.setPixmap(pixmap)
 
     def _set_editing_enabled(self, enabled: bool):
         """Enable or disable editing controls (for locked versions).
@@ -5429,36 +6418,9 @@ class VersionEditorPage(QWidget):
         Note: When locked, users can still view all data but cannot modify it.
         They can also still delete items (which marks them for removal in next version).
         """
-        # Mod editor controls - disable modification but allow viewing
-        self.mod_editor.save_btn.setEnabled(enabled)
-        # Delete is always enabled (users should be able to delete locked files/old versions)
-        # self.mod_editor.delete_btn.setEnabled(enabled)  # Keep enabled for deleting
-        self.mod_editor.id_edit.setReadOnly(not enabled)
-        self.mod_editor.hash_edit.setReadOnly(not enabled)
-        self.mod_editor.mod_id_edit.setReadOnly(not enabled)
-        self.mod_editor.file_id_edit.setReadOnly(not enabled)
-        self.mod_editor.url_edit.setReadOnly(not enabled)
-        self.mod_editor.install_location_edit.setReadOnly(not enabled)
-        self.mod_editor.file_name_edit.setReadOnly(not enabled)
-        self.mod_editor.display_name_edit.setReadOnly(not enabled)
-        self.mod_editor.info_name_edit.setReadOnly(not enabled)
-        self.mod_editor.auto_hash_btn.setEnabled(enabled)
-        self.mod_editor.curseforge_btn.setEnabled(enabled)
-        self.mod_editor.modrinth_btn.setEnabled(enabled)
-        self.mod_editor.url_btn.setEnabled(enabled)
-
-        # File editor controls
-        self.file_editor.save_btn.setEnabled(enabled)
-        # self.file_editor.delete_btn.setEnabled(enabled)  # Keep enabled for deleting
-        self.file_editor.info_name_edit.setReadOnly(not enabled)
-        self.file_editor.display_name_edit.setReadOnly(not enabled)
-        self.file_editor.file_name_edit.setReadOnly(not enabled)
-        self.file_editor.url_edit.setReadOnly(not enabled)
-        self.file_editor.download_path_edit.setReadOnly(not enabled)
-        self.file_editor.hash_edit.setReadOnly(not enabled)
-        self.file_editor.overwrite_check.setEnabled(enabled)
-        self.file_editor.extract_check.setEnabled(enabled)
-        self.file_editor.auto_hash_btn.setEnabled(enabled)
+        # Mod and file editors - disable modification but allow viewing
+        self.mod_editor.set_editing_enabled(enabled)
+        self.file_editor.set_editing_enabled(enabled)
 
         # Delete editor controls
         self.delete_editor.save_btn.setEnabled(enabled)
@@ -5488,10 +6450,9 @@ class VersionEditorPage(QWidget):
         elif index == 2:  # Delete tab
             if self.version_config.deletes and self.selected_delete_index < 0:
                 # Auto-select first delete entry
-                self.deletes_list.setCurrentRow(0)
-                first_item = self.deletes_list.item(0)
-                if first_item:
-                    self.on_delete_selected(first_item)
+                first_index = self.deletes_model.index(0)
+                self.deletes_list.setCurrentIndex(first_index)
+                self.on_delete_selected(first_index)
 
     def on_create_clicked(self):
         """Handle Create button click - save version to repo."""
@@ -5512,79 +6473,90 @@ class VersionEditorPage(QWidget):
             self.create_requested.emit(self.version_config)
 
     def refresh_mods_grid(self):
-        # Clear grid
-        while self.mods_grid.count():
-            item = self.mods_grid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        if not self.version_config:
-            return
-
-        row, col = 0, 0
-        max_cols = 4
-
-        # Add mod cards
-        for i, mod in enumerate(self.version_config.mods):
-            # Support both icon_path and cached icon_data
-            icon_data = getattr(mod, '_icon_data', None)
-            # Use GUI display name if set, otherwise fall back to display_name or id
-            gui_display = getattr(mod, '_gui_display_name', '') or mod.display_name or mod.id
-            card = ItemCard(gui_display, mod.icon_path, icon_data=icon_data)
-            card.clicked.connect(lambda idx=i: self.select_mod(idx))
-            card.double_clicked.connect(lambda idx=i: self.select_mod(idx))
-            self.mods_grid.addWidget(card, row, col)
-
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
-
-        # Add "Add" button only if version is not locked
-        if self.version_config and not self.version_config.is_locked():
-            add_card = ItemCard("", "", is_add_button=True)
-            add_card.clicked.connect(self.add_mod)
-            self.mods_grid.addWidget(add_card, row, col)
+        mods = self.version_config.mods if self.version_config else []
+        self._refresh_card_grid(self.mods_grid_widget, self.mods_grid, mods,
+                                self._mod_card_content, self._make_mod_card, self.add_mod)
 
     def refresh_files_grid(self):
-        # Clear grid
-        while self.files_grid.count():
-            item = self.files_grid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        if not self.version_config:
-            return
-
-        row, col = 0, 0
-        max_cols = 4
+        files = self.version_config.files if self.version_config else []
+        self._refresh_card_grid(self.files_grid_widget, self.files_grid, files,
+                                self._file_card_content, self._make_file_card, self.add_file)
 
-        # Add file cards
-        for i, file in enumerate(self.version_config.files):
-            # Use GUI display name if set, otherwise fall back to display_name or file_name
-            gui_display = getattr(file, '_gui_display_name', '') or file.display_name or file.file_name
-            card = ItemCard(gui_display, file.icon_path)
-            card.clicked.connect(lambda idx=i: self.select_file(idx))
-            self.files_grid.addWidget(card, row, col)
+    def _refresh_card_grid(self, grid_widget: QWidget, grid: QGridLayout, entries: list,
+                           card_content, make_card, on_add):
+        """Lay out one card per entry, reusing the cards already in the grid.
 
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
-
-        # Add "Add" button only if version is not locked
-        if self.version_config and not self.version_config.is_locked():
-            add_card = ItemCard("", "", is_add_button=True)
-            add_card.clicked.connect(self.add_file)
-            self.files_grid.addWidget(add_card, row, col)
+        Existing cards keep their index (and click handler) and just get new
+        content; cards are only created or deleted when the count changes.
+        """
+        with _bulk_update(grid_widget):
+            # Take the current cards out of the grid
+            cards = []
+            while grid.count():
+                widget = grid.takeAt(0).widget()
+                if isinstance(widget, ItemCard) and not widget.is_add_button:
+                    cards.append(widget)
+                elif widget is not None:
+                    widget.deleteLater()
+
+            max_cols = 4
+
+            # Add entry cards
+            for i, entry in enumerate(entries):
+                if i < len(cards):
+                    card = cards[i]
+                    card.set_content(*card_content(entry))
+                    card.set_selected(False)
+                else:
+                    card = make_card(i, entry)
+                grid.addWidget(card, *divmod(i, max_cols))
+
+            for card in cards[len(entries):]:
+                card.deleteLater()
+
+            # Add "Add" button only if version is not locked
+            if self.version_config and not self.version_config.is_locked():
+                add_card = ItemCard("", "", is_add_button=True)
+                add_card.clicked.connect(on_add)
+                grid.addWidget(add_card, *divmod(len(entries), max_cols))
+
+    @staticmethod
+    def _mod_card_content(mod: ModEntry) -> tuple:
+        # Use GUI display name if set, otherwise fall back to display_name or id;
+        # support both icon_path and cached icon_data
+        gui_display = getattr(mod, '_gui_display_name', '') or mod.display_name or mod.id
+        return gui_display, mod.icon_path, getattr(mod, '_icon_data', None)
+
+    @staticmethod
+    def _file_card_content(file: FileEntry) -> tuple:
+        # Use GUI display name if set, otherwise fall back to display_name or file_name
+        gui_display = getattr(file, '_gui_display_name', '') or file.display_name or file.file_name
+        return gui_display, file.icon_path, None
+
+    def _make_mod_card(self, index: int, mod: ModEntry) -> ItemCard:
+        name, icon_path, icon_data = self._mod_card_content(mod)
+        card = ItemCard(name, icon_path, icon_data=icon_data)
+        # Not double_clicked as well: the first press of a double-click already
+        # emits clicked, and a second select_mod would reload the editor
+        card.clicked.connect(lambda idx=index: self.select_mod(idx))
+        return card
+
+    def _make_file_card(self, index: int, file: FileEntry) -> ItemCard:
+        name, icon_path, _ = self._file_card_content(file)
+        card = ItemCard(name, icon_path)
+        card.clicked.connect(lambda idx=index: self.select_file(idx))
+        return card
+
+    def _update_card(self, grid: QGridLayout, index: int, content: tuple):
+        """Refresh the card at index in place after its entry was edited."""
+        item = grid.itemAt(index)
+        card = item.widget() if item else None
+        if isinstance(card, ItemCard):
+            card.set_content(*content)
+            card.set_selected(False)
 
     def refresh_deletes_list(self):
-        self.deletes_list.clear()
-        if not self.version_config:
-            return
-
-        for delete in self.version_config.deletes:
-            self.deletes_list.addItem(f"{delete.path} ({delete.type})")
+        self.deletes_model.set_entries(self.version_config.deletes if self.version_config else [])
 
     def select_mod(self, index: int):
         if not self.version_config or index < 0 or index >= len(self.version_config.mods):
@@ -5612,8 +6584,8 @@ class VersionEditorPage(QWidget):
             if isinstance(widget, ItemCard) and not widget.is_add_button:
                 widget.set_selected(i == index)
 
-    def on_delete_selected(self, item):
-        index = self.deletes_list.row(item)
+    def on_delete_selected(self, model_index: QModelIndex):
+        index = model_index.row()
         if not self.version_config or index < 0 or index >= len(self.version_config.deletes):
             return
         self.selected_delete_index = index
@@ -5669,7 +6641,7 @@ class VersionEditorPage(QWidget):
         self._load_remaining_icons()
 
         existing_ids = [m.id for m in self.version_config.mods]
-        dialog = ModBrowserDialog(existing_ids, self.version_config.version, self)
+        dialog = self._get_mod_browser(existing_ids)
         if dialog.exec():
             mod = dialog.get_mod()
             if mod:
@@ -5683,6 +6655,22 @@ class VersionEditorPage(QWidget):
                 self.mod_editor.load_mod(mod)
                 self.mod_right_stack.setCurrentWidget(self.mod_editor)
 
+    def _get_mod_browser(self, existing_ids: List[str]) -> ModBrowserDialog:
+        """Return the page's mod browser, reset for another add.
+
+        The dialog is expensive to build, so it is kept between uses and only
+        rebuilt when the theme changed since it was created.
+        """
+        dialog = self._mod_browser
+        if dialog is not None and dialog._theme is get_current_theme():
+            dialog.reset(existing_ids, self.version_config.version)
+            return dialog
+        if dialog is not None:
+            dialog._cleanup_threads()
+            dialog.deleteLater()
+        self._mod_browser = ModBrowserDialog(existing_ids, self.version_config.version, self)
+        return self._mod_browser
+
     def add_file(self):
         if not self.version_config:
             return
@@ -5705,12 +6693,22 @@ class VersionEditorPage(QWidget):
 
     def on_mod_changed(self):
         self.version_config.modified = True
-        self.refresh_mods_grid()
+        # Only the edited mod's card changes; a pending mod has no card yet
+        # (on_mod_saved adds it), so there is no need to rebuild the grid
+        mod = self.mod_editor.current_mod
+        for i, m in enumerate(self.version_config.mods):
+            if m is mod:
+                self._update_card(self.mods_grid, i, self._mod_card_content(mod))
+                break
         self.version_modified.emit()
 
     def on_file_changed(self):
         self.version_config.modified = True
-        self.refresh_files_grid()
+        file_entry = self.file_editor.current_file
+        for i, f in enumerate(self.version_config.files):
+            if f is file_entry:
+                self._update_card(self.files_grid, i, self._file_card_content(file_entry))
+                break
         self.version_modified.emit()
 
     def on_delete_changed(self):
@@ -5892,9 +6890,9 @@ class VersionEditorPage(QWidget):
         )
         if file_path:
             self.version_config.icon_path = file_path
-            pixmap = QPixmap(file_path)
+            pixmap = load_pixmap(file_path, 60)
             if not pixmap.isNull():
-                self.version_icon_preview.setPixmap(pixmap.scaled(60, 60, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+                self.version_icon_preview.setPixmap(pixmap)
                 # Update the style to show border around icon
                 theme = get_current_theme()
                 self.version_icon_preview.setStyleSheet(f"border: 2px solid {theme['accent']}; border-radius: 8px;")
@@ -5911,63 +6909,16 @@ class VersionEditorPage(QWidget):
         self.version_icon_preview.setStyleSheet(f"border: 2px dashed {theme['border']}; border-radius: 8px;")
         self.version_modified.emit()
 
-    def refresh_editor_panels_style(self):
-        """Refresh the styling of editor panel containers when theme changes."""
-        theme = get_current_theme()
-        container_style = f"""
-            QFrame {{
-                background-color: {theme['bg_secondary']};
-                border: none;
-                border-radius: 8px;
-                margin: 4px;
-            }}
-            QScrollBar:vertical {{
-                background-color: {theme['bg_secondary']};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {theme['border']};
-                border-radius: 4px;
-                min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {theme['accent']};
-            }}
-        """
-        placeholder_style = f"color: {theme['text_secondary']}; font-size: 16px; font-style: italic; background-color: transparent; padding: 16px;"
-
-        if hasattr(self, 'mod_right_container'):
-            self.mod_right_container.setStyleSheet(container_style)
-        if hasattr(self, 'file_right_container'):
-            self.file_right_container.setStyleSheet(container_style)
-        if hasattr(self, 'delete_right_container'):
-            self.delete_right_container.setStyleSheet(container_style)
-
-        # Update placeholder label styles
-        if hasattr(self, 'mod_placeholder'):
-            for label in self.mod_placeholder.findChildren(QLabel):
-                label.setStyleSheet(placeholder_style)
-        if hasattr(self, 'file_placeholder'):
-            for label in self.file_placeholder.findChildren(QLabel):
-                label.setStyleSheet(placeholder_style)
-        if hasattr(self, 'delete_placeholder'):
-            for label in self.delete_placeholder.findChildren(QLabel):
-                label.setStyleSheet(placeholder_style)
-
     # === Lazy Icon Loading Methods ===
 
-    def _cancel_icon_load_threads(self):
-        """Cancel all running icon load threads and wait for them to finish."""
-        for thread in self._icon_load_threads:
-            try:
-                if thread.isRunning():
-                    thread.stop()
-                    thread.wait(1000)
-            except RuntimeError:
-                # Handle case where Qt C++ object was deleted
-                pass
-        self._icon_load_threads.clear()
+    def _cancel_icon_loads(self):
+        """Abandon the icon fetches of the previously loaded version."""
+        self._icon_cancel.set()
+        ModIconTask.pool().clear()  # Drop fetches that haven't started yet
+        # Fresh signals so results still in flight from the old tasks are ignored
+        self._icon_signals = ModIconSignals()
+        self._icon_signals.icon_fetched.connect(self._on_icon_task_done)
+        self._icon_cancel = threading.Event()
 
     def _load_initial_icons(self):
         """Load the first INITIAL_ICON_LOAD_COUNT icons when a version is opened."""
@@ -6013,22 +6964,26 @@ class VersionEditorPage(QWidget):
         source_type = source.get('type', '')
 
         if source_type == 'modrinth':
-            project_slug = source.get('projectSlug', '')
-            if project_slug:
-                thread = IconFetcher({'source': source, 'id': mod.id})
-                thread.icon_fetched.connect(lambda mod_id, data, idx=mod_index: self._on_mod_icon_loaded(idx, data))
-                thread.finished.connect(thread.deleteLater)
-                self._icon_load_threads.append(thread)
-                thread.start()
+            project = source.get('projectSlug', '')
         elif source_type == 'curseforge':
             # CurseForge icons require fetching project info first
             project_id = source.get('projectId', '')
-            if project_id:
-                thread = _CurseForgeIconFetcher(str(project_id), mod.id, mod_index)
-                thread.icon_fetched.connect(self._on_mod_icon_loaded)
-                thread.finished.connect(thread.deleteLater)
-                self._icon_load_threads.append(thread)
-                thread.start()
+            project = str(project_id) if project_id else ''
+        else:
+            return
+        if not project:
+            return
+
+        icon_data = ModIconTask.cached(source_type, project)
+        if icon_data:
+            self._on_mod_icon_loaded(mod_index, icon_data)
+            return
+        ModIconTask.pool().start(
+            ModIconTask(source_type, project, mod_index, self._icon_signals, self._icon_cancel))
+
+    def _on_icon_task_done(self, mod_index: int, icon_data: bytes):
+        if self.sender() is self._icon_signals:  # Not from a cancelled load
+            self._on_mod_icon_loaded(mod_index, icon_data)
 
     def _on_mod_icon_loaded(self, mod_index: int, icon_data: bytes):
         """Handle when a mod icon has been loaded."""
@@ -6047,44 +7002,6 @@ class VersionEditorPage(QWidget):
                     card.set_icon_from_bytes(icon_data)
 
 
-class _CurseForgeIconFetcher(QThread):
-    """Background thread for fetching CurseForge mod icons."""
-    icon_fetched = pyqtSignal(int, bytes)  # mod_index, icon_bytes
-
-    def __init__(self, project_id: str, mod_id: str, mod_index: int):
-        super().__init__()
-        self.project_id = project_id
-        self.mod_id = mod_id
-        self.mod_index = mod_index
-        self._running = True
-
-    def run(self):
-        """Fetch icon from CurseForge API."""
-        if not self._running:
-            return
-        try:
-            # Use curse.tools proxy API
-            url = f"{CF_PROXY_BASE_URL}/mods/{self.project_id}"
-            req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read())
-                mod_data = data.get('data', {})
-                logo = mod_data.get('logo', {})
-                icon_url = logo.get('thumbnailUrl', '') or logo.get('url', '')
-
-                if icon_url and self._running:
-                    with urllib.request.urlopen(icon_url, timeout=10) as img_response:
-                        icon_data = img_response.read()
-                        if icon_data and self._running:
-                            self.icon_fetched.emit(self.mod_index, icon_data)
-        except Exception:
-            pass  # Silently fail icon loads
-
-    def stop(self):
-        self._running = False
-
-
-
 # === Version Selection Page ===
 class VersionSelectionPage(QWidget):
     version_selected = pyqtSignal(str)
@@ -6137,76 +7054,76 @@ class VersionSelectionPage(QWidget):
         self.refresh_grid()
 
     def refresh_grid(self):
-        # Clear grid
-        while self.grid.count():
-            item = self.grid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        row, col = 0, 0
-        max_cols = 5
-
-        def version_sort_key(v: str):
-            """Sort key for semantic versions like 1.0.0, 1.0.0-beta, etc."""
-            # Split into base version and pre-release tag
-            parts = v.split('-', 1)
-            base = parts[0]
-            tag = parts[1] if len(parts) > 1 else ''
+        with _bulk_update(self.grid_widget):
+            # Clear grid
+            while self.grid.count():
+                item = self.grid.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+
+            row, col = 0, 0
+            max_cols = 5
+
+            def version_sort_key(v: str):
+                """Sort key for semantic versions like 1.0.0, 1.0.0-beta, etc."""
+                # Split into base version and pre-release tag
+                parts = v.split('-', 1)
+                base = parts[0]
+                tag = parts[1] if len(parts) > 1 else ''
+
+                # Parse base version numbers
+                nums = []
+                for x in base.split('.'):
+                    try:
+                        nums.append(int(x))
+                    except ValueError:
+                        nums.append(0)
 
-            # Parse base version numbers
-            nums = []
-            for x in base.split('.'):
-                try:
-                    nums.append(int(x))
-                except ValueError:
-                    nums.append(0)
+                # Pre-release versions sort before release (empty tag = release)
+                # Release versions have higher priority (1), pre-release have lower (0)
+                tag_priority = 0 if tag else 1
 
-            # Pre-release versions sort before release (empty tag = release)
-            # Release versions have higher priority (1), pre-release have lower (0)
-            tag_priority = 0 if tag else 1
+                return (nums, tag_priority, tag)
 
-            return (nums, tag_priority, tag)
+            # Sort versions (newest first)
+            sorted_versions = sorted(self.versions.keys(), key=version_sort_key, reverse=True)
 
-        # Sort versions (newest first)
-        sorted_versions = sorted(self.versions.keys(), key=version_sort_key, reverse=True)
+            # Update latest version label
+            if sorted_versions:
+                latest = sorted_versions[0]
+                theme = get_current_theme()
+                self.latest_version_label.setText(f"📌 Latest Version: {latest}")
+                self.latest_version_label.setStyleSheet(f"color: {theme['accent']}; font-weight: bold; font-size: 14px; padding: 8px 0;")
+            else:
+                self.latest_version_label.setText("")
 
-        # Update latest version label
-        if sorted_versions:
-            latest = sorted_versions[0]
-            theme = get_current_theme()
-            self.latest_version_label.setText(f"📌 Latest Version: {latest}")
-            self.latest_version_label.setStyleSheet(f"color: {theme['accent']}; font-weight: bold; font-size: 14px; padding: 8px 0;")
-        else:
-            self.latest_version_label.setText("")
-
-        # Add version cards
-        for i, version in enumerate(sorted_versions):
-            config = self.versions[version]
-            icon_path = config.icon_path if hasattr(config, 'icon_path') else ""
-            is_latest = (i == 0)
-            is_new = config.is_new() if hasattr(config, 'is_new') else True
-
-            # Use VersionCard for versions (with delete button for non-new ones)
-            card = VersionCard(version, is_latest=is_latest, is_new=is_new, icon_path=icon_path)
-            card.clicked.connect(lambda v=version: self.version_selected.emit(v))
-            card.delete_clicked.connect(self.on_delete_version)
-            self.grid.addWidget(card, row, col)
-
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
-
-        # Add "Add" button
-        add_card = VersionCard("", is_add_button=True)
-        add_card.clicked.connect(lambda v="": self.add_version())
-        self.grid.addWidget(add_card, row, col)
+            # Add version cards
+            for i, version in enumerate(sorted_versions):
+                config = self.versions[version]
+                icon_path = config.icon_path if hasattr(config, 'icon_path') else ""
+                is_latest = (i == 0)
+                is_new = config.is_new() if hasattr(config, 'is_new') else True
+
+                # Use VersionCard for versions (with delete button for non-new ones)
+                card = VersionCard(version, is_latest=is_latest, is_new=is_new, icon_path=icon_path)
+                card.clicked.connect(lambda v=version: self.version_selected.emit(v))
+                card.delete_clicked.connect(self.on_delete_version)
+                self.grid.addWidget(card, row, col)
+
+                col += 1
+                if col >= max_cols:
+                    col = 0
+                    row += 1
+
+            # Add "Add" button
+            add_card = VersionCard("", is_add_button=True)
+            add_card.clicked.connect(lambda v="": self.add_version())
+            self.grid.addWidget(add_card, row, col)
 
     def on_delete_version(self, version: str):
         """Handle version delete request."""
         # Show confirmation dialog with note about saving
-        dialog = ConfirmDeleteDialog(version, "version", self)
-        if dialog.exec():
+        if ConfirmDeleteDialog.confirm(version, "version", self):
             # Check if version is saved to repo before showing info
             version_is_saved = False
             if version in self.versions:
@@ -6335,26 +7252,8 @@ class ConfigurationPage(QWidget):
         advanced_group = QGroupBox("Advanced Options")
         advanced_layout = QFormLayout(advanced_group)
 
-        self.check_current_version_check = QCheckBox()
-        self.check_current_version_check.setChecked(True)
-        self.check_current_version_check.stateChanged.connect(self.on_field_changed)
-        advanced_layout.addRow("Check Current Version:", self.check_current_version_check)
-
-        self.max_retries_spin = QSpinBox()
-        self.max_retries_spin.setRange(1, 10)
-        self.max_retries_spin.setValue(3)
-        self.max_retries_spin.valueChanged.connect(self.on_field_changed)
-        advanced_layout.addRow("Max Retries:", self.max_retries_spin)
-
-        self.backup_keep_spin = QSpinBox()
-        self.backup_keep_spin.setRange(1, 20)
-        self.backup_keep_spin.setValue(5)
-        self.backup_keep_spin.valueChanged.connect(self.on_field_changed)
-        advanced_layout.addRow("Backups to Keep:", self.backup_keep_spin)
-
-        self.debug_mode_check = QCheckBox()
-        self.debug_mode_check.stateChanged.connect(self.on_field_changed)
-        advanced_layout.addRow("Debug Mode:", self.debug_mode_check)
+        self.advanced_form = SchemaForm(advanced_layout, MODPACK_CONFIG_FORM, self.on_field_changed)
+        self.advanced_form.load(ModpackConfig())  # Defaults
 
         scroll_layout.addWidget(advanced_group)
         scroll_layout.addStretch()
@@ -6385,8 +7284,7 @@ class ConfigurationPage(QWidget):
         if self._repo_url:
             # Parse GitHub URL to create raw URL
             # e.g., https://github.com/user/repo -> https://raw.githubusercontent.com/user/repo/main/
-            pattern = r'github\.com[:/]([^/]+)/([^/\s]+?)(?:\.git)?/?$'
-            match = re.search(pattern, self._repo_url)
+            match = GITHUB_REPO_RE.search(self._repo_url)
             if match:
                 owner = match.group(1)
                 repo = match.group(2).replace('.git', '')
@@ -6409,10 +7307,7 @@ class ConfigurationPage(QWidget):
         self.mods_json_edit.setText(config.mods_json or 'mods.json')
         self.files_json_edit.setText(config.files_json or 'files.json')
         self.deletes_json_edit.setText(config.deletes_json or 'deletes.json')
-        self.check_current_version_check.setChecked(config.check_current_version)
-        self.max_retries_spin.setValue(config.max_retries)
-        self.backup_keep_spin.setValue(config.backup_keep)
-        self.debug_mode_check.setChecked(config.debug_mode)
+        self.advanced_form.load(config)
 
         self.blockSignals(False)
 
@@ -6432,10 +7327,7 @@ class ConfigurationPage(QWidget):
         self.modpack_config.mods_json = self.mods_json_edit.text().strip() or 'mods.json'
         self.modpack_config.files_json = self.files_json_edit.text().strip() or 'files.json'
         self.modpack_config.deletes_json = self.deletes_json_edit.text().strip() or 'deletes.json'
-        self.modpack_config.check_current_version = self.check_current_version_check.isChecked()
-        self.modpack_config.max_retries = self.max_retries_spin.value()
-        self.modpack_config.backup_keep = self.backup_keep_spin.value()
-        self.modpack_config.debug_mode = self.debug_mode_check.isChecked()
+        self.advanced_form.save(self.modpack_config)
 
         self.config_changed.emit()
 
@@ -6546,11 +7438,10 @@ class ThemePage(QWidget):
 
     def _populate_theme_combo(self):
         """Populate the theme combo box with all themes."""
-        self.theme_combo.blockSignals(True)
-        self.theme_combo.clear()
-        for key, theme in THEMES.items():
-            self.theme_combo.addItem(theme['name'], key)
-        self.theme_combo.blockSignals(False)
+        with _bulk_update(self.theme_combo):
+            self.theme_combo.clear()
+            for key, theme in THEMES.items():
+                self.theme_combo.addItem(theme['name'], key)
 
     def _populate_custom_themes_list(self):
         """Populate the list of custom themes."""
@@ -6747,6 +7638,9 @@ class MainWindow(QMainWindow):
         self.all_deletes: Dict[str, List[DeleteEntry]] = {}  # version -> list of deletes
         self.modpack_config: Optional[ModpackConfig] = None
         self.file_shas: Dict[str, str] = {}  # filename -> sha for GitHub updates
+        self._fetch_signals: Optional[ConfigFetchSignals] = None  # In-flight fetch, if any
+        self._fetch_progress: Optional[QProgressDialog] = None  # Blocks the window while fetching
+        self._upload_signals: Optional[ConfigUploadSignals] = None  # In-flight upload, if any
 
         self.load_editor_config()
         self.setup_ui()
@@ -6782,13 +7676,16 @@ class MainWindow(QMainWindow):
         sidebar_layout.addWidget(logo_label)
 
         # Navigation
-        self.nav_list = QListWidget()
-        self.nav_list.addItem("📦 Versions")
-        self.nav_list.addItem("🔧 Configuration")
-        self.nav_list.addItem("🎨 Theme")
-        self.nav_list.addItem("⚙️ Settings")
-        self.nav_list.setCurrentRow(0)
-        self.nav_list.currentRowChanged.connect(self.on_nav_changed)
+        self.nav_model = QStringListModel(
+            ["📦 Versions", "🔧 Configuration", "🎨 Theme", "⚙️ Settings"], self
+        )
+        self.nav_list = QListView()
+        self.nav_list.setModel(self.nav_model)
+        self.nav_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.nav_list.setCurrentIndex(self.nav_model.index(0))
+        self.nav_list.selectionModel().currentChanged.connect(
+            lambda current, _previous: self.on_nav_changed(current.row())
+        )
         sidebar_layout.addWidget(self.nav_list)
 
         sidebar_layout.addStretch()
@@ -6912,9 +7809,8 @@ class MainWindow(QMainWindow):
         config_path = Path.home() / ".modupdater" / CONFIG_FILE
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    self.editor_config = json.load(f)
-                    self.current_theme = self.editor_config.get('theme', 'light')
+                self.editor_config = _read_json(config_path)
+                self.current_theme = self.editor_config.get('theme', 'light')
             except:
                 pass
 
@@ -6926,11 +7822,14 @@ class MainWindow(QMainWindow):
 
         self.editor_config['theme'] = self.current_theme
 
-        try:
-            with open(config_path, 'w') as f:
-                json.dump(self.editor_config, f, indent=2)
-        except Exception as e:
-            print(f"Failed to save config: {e}")
+        task = SaveTask(config_path, self.editor_config)
+        task.signals.finished.connect(self._on_editor_config_saved)
+        SaveTask.submit(task)
+
+    def _on_editor_config_saved(self, path: str, error: str):
+        """Report a failed background save of the editor config."""
+        if error:
+            print(f"Failed to save config: {error}")
 
     def check_setup(self):
         """Check if first-time setup is needed."""
@@ -7008,12 +7907,47 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Connection Error", f"Failed to connect to GitHub:\n{str(e)}")
 
     def fetch_configs(self):
-        """Fetch config files from GitHub (single files, not per-version folders)."""
+        """Fetch config files from GitHub (single files, not per-version folders).
+
+        The downloads and JSON parsing run on the global thread pool;
+        _on_configs_fetched applies the results on the GUI thread. A modal
+        progress dialog keeps the old data from being edited or saved
+        meanwhile, since the fetch replaces it wholesale.
+        """
         if not self.github_api:
             return
 
         config_path = self.editor_config.get('github', {}).get('config_path', '')
 
+        task = ConfigFetchTask(self.github_api, config_path)
+        # Only the most recent fetch may apply its results
+        self._fetch_signals = task.signals
+        task.signals.finished.connect(self._on_configs_fetched)
+        if self._fetch_progress is None:
+            progress = QProgressDialog("Loading configs from GitHub...", None, 0, 0, self)
+            progress.setWindowModality(Qt.WindowModality.WindowModal)
+            progress.setMinimumDuration(0)
+            progress.setCancelButton(None)
+            progress.setWindowFlags(progress.windowFlags() & ~Qt.WindowType.WindowCloseButtonHint)
+            progress.show()
+            self._fetch_progress = progress
+        QThreadPool.globalInstance().start(task)
+
+    def _fetch_in_progress(self) -> bool:
+        """Tell the user to wait if a config fetch is still running."""
+        if self._fetch_signals is None:
+            return False
+        QMessageBox.information(self, "Loading", "Configs are still loading from GitHub. Please wait.")
+        return True
+
+    def _on_configs_fetched(self, results: dict):
+        """Build the data model from a finished ConfigFetchTask."""
+        if self.sender() is not self._fetch_signals:
+            return  # Superseded by a newer fetch
+        self._fetch_signals = None
+        self._fetch_progress.close()
+        self._fetch_progress = None
+
         try:
             # Reset data
             self.all_mods = []
@@ -7024,62 +7958,49 @@ class MainWindow(QMainWindow):
             self.versions = {}
             self._has_unsaved_deletions = False  # Reset deletion flag
 
-            # Fetch config.json (main config file)
-            config_file = f"{config_path}/config.json" if config_path else "config.json"
-            try:
-                content, sha = self.github_api.get_file(config_file)
-                if content:
-                    data = json.loads(content)
-                    self.modpack_config = ModpackConfig(data)
-                    self.modpack_config._sha = sha
-                    self.file_shas['config.json'] = sha
-                    self.config_page.load_config(self.modpack_config)
-            except Exception as e:
-                print(f"No config.json found, creating default: {e}")
+            # config.json (main config file)
+            data, sha, error = results['config.json']
+            if error is None and data is not None:
+                self.modpack_config = ModpackConfig(data)
+                self.modpack_config._sha = sha
+                self.file_shas['config.json'] = sha
+            else:
+                print(f"No config.json found, creating default: {error or 'not in repository'}")
                 self.modpack_config = ModpackConfig()
-                self.config_page.load_config(self.modpack_config)
-
-            # Fetch mods.json
-            mods_file = f"{config_path}/mods.json" if config_path else "mods.json"
-            try:
-                content, sha = self.github_api.get_file(mods_file)
-                if content:
-                    data = json.loads(content)
-                    if isinstance(data, list):
-                        self.all_mods = [ModEntry(m) for m in data]
-                    self.file_shas['mods.json'] = sha
-            except Exception as e:
-                print(f"No mods.json found: {e}")
-
-            # Fetch files.json
-            files_file = f"{config_path}/files.json" if config_path else "files.json"
-            try:
-                content, sha = self.github_api.get_file(files_file)
-                if content:
-                    data = json.loads(content)
-                    files_data = data.get('files', []) if isinstance(data, dict) else data
-                    if isinstance(files_data, list):
-                        self.all_files = [FileEntry(f) for f in files_data]
-                    self.file_shas['files.json'] = sha
-            except Exception as e:
-                print(f"No files.json found: {e}")
+            self.config_page.load_config(self.modpack_config)
 
-            # Fetch deletes.json (new format with version groups)
-            deletes_file = f"{config_path}/deletes.json" if config_path else "deletes.json"
-            try:
-                content, sha = self.github_api.get_file(deletes_file)
-                if content:
-                    data = json.loads(content)
-                    # Parse new format: { "safetyMode": true, "deletions": [{"version": "1.0.0", "paths": [...]}] }
-                    deletions = data.get('deletions', [])
-                    for deletion in deletions:
-                        version = deletion.get('version', '')
-                        if version:
-                            paths = deletion.get('paths', [])
-                            self.all_deletes[version] = [DeleteEntry(p) for p in paths]
-                    self.file_shas['deletes.json'] = sha
-            except Exception as e:
-                print(f"No deletes.json found: {e}")
+            # mods.json
+            data, sha, error = results['mods.json']
+            if error is not None:
+                print(f"No mods.json found: {error}")
+            elif data is not None:
+                if isinstance(data, list):
+                    self.all_mods = [ModEntry(m) for m in data]
+                self.file_shas['mods.json'] = sha
+
+            # files.json
+            data, sha, error = results['files.json']
+            if error is not None:
+                print(f"No files.json found: {error}")
+            elif data is not None:
+                files_data = data.get('files', []) if isinstance(data, dict) else data
+                if isinstance(files_data, list):
+                    self.all_files = [FileEntry(f) for f in files_data]
+                self.file_shas['files.json'] = sha
+
+            # deletes.json (new format with version groups)
+            data, sha, error = results['deletes.json']
+            if error is not None:
+                print(f"No deletes.json found: {error}")
+            elif data is not None:
+                # Parse new format: { "safetyMode": true, "deletions": [{"version": "1.0.0", "paths": [...]}] }
+                deletions = data.get('deletions', [])
+                for deletion in deletions:
+                    version = deletion.get('version', '')
+                    if version:
+                        paths = deletion.get('paths', [])
+                        self.all_deletes[version] = [DeleteEntry(p) for p in paths]
+                self.file_shas['deletes.json'] = sha
 
             # Build versions based on unique "since" values from mods and files
             self._build_versions_from_data()
@@ -7112,25 +8033,30 @@ class MainWindow(QMainWindow):
         for version in self.all_deletes.keys():
             all_versions.add(version)
 
+        # Parse the "since" column once: every version string gets one sort key,
+        # so the per-version scans below are tuple compares instead of string parsing
+        mod_since = [mod.since for mod in self.all_mods]
+        file_since = [f.since for f in self.all_files]
+        keys = _version_keys(mod_since + file_since + list(all_versions))
+        mod_keys = [keys[v] for v in mod_since]
+        file_keys = [keys[v] for v in file_since]
+
         # Create VersionConfig for each version
         self.versions = {}
         for version in all_versions:
             version_config = VersionConfig(version)
+            version_key = keys[version]
 
             # Add mods that were introduced at or before this version
-            for mod in self.all_mods:
-                if self._compare_versions(mod.since, version) <= 0:
+            for mod, key in zip(self.all_mods, mod_keys):
+                if key <= version_key:
                     # Create a copy for this version
-                    mod_copy = ModEntry(mod.to_dict())
-                    mod_copy.since = mod.since
-                    version_config.mods.append(mod_copy)
+                    version_config.mods.append(mod.copy())
 
             # Add files that were introduced at or before this version
-            for f in self.all_files:
-                if self._compare_versions(f.since, version) <= 0:
-                    file_copy = FileEntry(f.to_dict())
-                    file_copy.since = f.since
-                    version_config.files.append(file_copy)
+            for f, key in zip(self.all_files, file_keys):
+                if key <= version_key:
+                    version_config.files.append(f.copy())
 
             # Add deletes for this specific version
             if version in self.all_deletes:
@@ -7144,23 +8070,7 @@ class MainWindow(QMainWindow):
 
     def _compare_versions(self, v1: str, v2: str) -> int:
         """Compare two version strings. Returns positive if v1 > v2, negative if v1 < v2, 0 if equal."""
-        def parse(v):
-            if not v or not v.strip():
-                return [0]
-            parts = v.strip().split('.')
-            nums = []
-            for x in parts:
-                x = x.strip()
-                if not x:
-                    nums.append(0)
-                    continue
-                try:
-                    nums.append(int(x))
-                except ValueError:
-                    nums.append(0)
-            return nums if nums else [0]
-
-        p1, p2 = parse(v1), parse(v2)
+        p1, p2 = _version_parts(v1), _version_parts(v2)
         # Pad with zeros
         while len(p1) < len(p2):
             p1.append(0)
@@ -7185,17 +8095,8 @@ class MainWindow(QMainWindow):
         # Update global theme for widget access
         set_current_theme(theme_key)
 
-        # Generate and apply stylesheet
-        stylesheet = generate_stylesheet(theme)
-
-        # Add sidebar-specific styling
-        stylesheet += f"""
-        QWidget#sidebar {{
-            background-color: {theme['bg_sidebar']};
-        }}
-        """
-
-        QApplication.instance().setStyleSheet(stylesheet)
+        # Apply stylesheet
+        apply_stylesheet(theme)
 
         # Update theme page if it exists
         if hasattr(self, 'theme_page'):
@@ -7206,7 +8107,6 @@ class MainWindow(QMainWindow):
         if hasattr(self.version_editor_page, 'version_config') and self.version_editor_page.version_config:
             self.version_editor_page.refresh_mods_grid()
             self.version_editor_page.refresh_files_grid()
-            self.version_editor_page.refresh_editor_panels_style()
 
     def on_nav_changed(self, index: int):
         """Handle navigation list selection change."""
@@ -7222,11 +8122,13 @@ class MainWindow(QMainWindow):
     def show_version_selection(self):
         """Show the version selection page."""
         self.stack.setCurrentWidget(self.version_selection_page)
-        self.nav_list.setCurrentRow(0)
+        self.nav_list.setCurrentIndex(self.nav_model.index(0))
         self.sidebar.setVisible(True)  # Show sidebar when returning to version selection
 
     def open_version(self, version: str):
         """Open a version for editing."""
+        if self._fetch_in_progress():
+            return
         if version in self.versions:
             self.version_editor_page.load_version(self.versions[version])
             self.stack.setCurrentWidget(self.version_editor_page)
@@ -7292,25 +8194,29 @@ class MainWindow(QMainWindow):
         if not self.github_api:
             QMessageBox.warning(self, "Not Connected", "Please configure GitHub connection first.")
             return
+        if self._fetch_in_progress():
+            return
 
         version = version_config.version
         config_path = self.editor_config.get('github', {}).get('config_path', '')
 
         # Add new mods to all_mods with their since field
+        known_mod_ids = {m.id for m in self.all_mods}
         for mod in version_config.mods:
             # Check if mod already exists
-            existing = [m for m in self.all_mods if m.id == mod.id]
-            if not existing:
+            if mod.id not in known_mod_ids:
                 mod.since = version
                 self.all_mods.append(mod)
+                known_mod_ids.add(mod.id)
 
         # Add new files to all_files
+        known_file_urls = {ef.url for ef in self.all_files}
         for f in version_config.files:
-            # Check if file already exists (by URL or name)
-            existing = [ef for ef in self.all_files if ef.url == f.url]
-            if not existing:
+            # Check if file already exists (by URL)
+            if f.url not in known_file_urls:
                 f.since = version
                 self.all_files.append(f)
+                known_file_urls.add(f.url)
 
         # Add deletes for this version
         if version_config.deletes:
@@ -7326,17 +8232,17 @@ class MainWindow(QMainWindow):
 
         # Prepare config.json
         config_file = f"{config_path}/config.json" if config_path else "config.json"
-        config_content = json.dumps(self.modpack_config.to_dict(), indent=2)
+        config_content = _json_dumps(self.modpack_config.to_dict())
         changes.append((config_file, config_content, self.file_shas.get('config.json')))
 
         # Prepare mods.json (all mods)
         mods_file = f"{config_path}/mods.json" if config_path else "mods.json"
-        mods_content = json.dumps([m.to_dict() for m in self.all_mods], indent=2)
+        mods_content = _json_dumps([m.to_dict() for m in self.all_mods])
         changes.append((mods_file, mods_content, self.file_shas.get('mods.json')))
 
         # Prepare files.json (all files)
         files_file = f"{config_path}/files.json" if config_path else "files.json"
-        files_content = json.dumps({'files': [f.to_dict() for f in self.all_files]}, indent=2)
+        files_content = _json_dumps({'files': [f.to_dict() for f in self.all_files]})
         changes.append((files_file, files_content, self.file_shas.get('files.json')))
 
         # Prepare deletes.json (all versions' deletes in new format)
@@ -7352,39 +8258,19 @@ class MainWindow(QMainWindow):
             'safetyMode': True,
             'deletions': deletions_list
         }
-        deletes_content = json.dumps(deletes_obj, indent=2)
+        deletes_content = _json_dumps(deletes_obj)
         changes.append((deletes_file, deletes_content, self.file_shas.get('deletes.json')))
+        changes = self._drop_unchanged(changes)
 
-        # Show progress (without cancel button - disable close)
-        progress = QProgressDialog(f"Creating version {version}...", None, 0, len(changes), self)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.setCancelButton(None)  # Remove cancel button
-        progress.setWindowFlags(progress.windowFlags() & ~Qt.WindowType.WindowCloseButtonHint)
-
-        errors = []
-
-        for i, (path, content, sha) in enumerate(changes):
-            progress.setValue(i)
-            QApplication.processEvents()
-
-            try:
-                result = self.github_api.create_or_update_file(
-                    path=path,
-                    content=content,
-                    message=f"Update to version {version}",
-                    sha=sha
-                )
-                # Update SHA
-                new_sha = result.get('content', {}).get('sha')
-                if new_sha:
-                    filename = path.split('/')[-1]
-                    self.file_shas[filename] = new_sha
-            except Exception as e:
-                errors.append(f"{path}: {str(e)}")
+        def on_uploaded(errors):
+            self._on_version_created(version_config, errors)
 
-        progress.setValue(len(changes))
+        self._upload_changes(changes, f"Update to version {version}",
+                             f"Creating version {version}...", on_uploaded)
 
+    def _on_version_created(self, version_config: VersionConfig, errors: List[str]):
+        """Finish on_create_version once its upload has completed."""
+        version = version_config.version
         if errors:
             QMessageBox.warning(self, "Errors", "Some files failed to save:\n\n" + "\n".join(errors))
         else:
@@ -7404,6 +8290,52 @@ class MainWindow(QMainWindow):
             # Refresh the editor to show locked state
             self.version_editor_page.load_version(version_config)
 
+    @staticmethod
+    def _drop_unchanged(changes):
+        """Filter out (path, content, sha) changes whose content is already in the repo.
+
+        sha is the blob SHA of the file as last fetched or saved, so an equal
+        blob SHA for the new content means uploading it would change nothing.
+        """
+        return [change for change in changes
+                if change[2] is None or _git_blob_sha(change[1]) != change[2]]
+
+    def _upload_changes(self, changes, message: str, label: str, on_done, show_paths: bool = False):
+        """Upload (path, content, sha) changes in the background behind a modal progress dialog.
+
+        The window stays responsive while the requests run. Once every file
+        has been tried, file_shas is updated and on_done(errors) is called
+        on the GUI thread.
+        """
+        if not changes:
+            on_done([])
+            return
+
+        # Show progress (without cancel button - disable close)
+        progress = QProgressDialog(label, None, 0, len(changes), self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setCancelButton(None)  # Remove cancel button
+        progress.setWindowFlags(progress.windowFlags() & ~Qt.WindowType.WindowCloseButtonHint)
+
+        def on_progress(i, path):
+            progress.setValue(i)
+            if show_paths:
+                progress.setLabelText(f"Saving {path}...")
+
+        def on_finished(new_shas, errors):
+            self._upload_signals = None
+            # Update SHAs for future saves
+            self.file_shas.update(new_shas)
+            progress.setValue(len(changes))
+            on_done(errors)
+
+        task = ConfigUploadTask(self.github_api, changes, message)
+        self._upload_signals = task.signals  # Keep the signals alive until finished
+        task.signals.progress.connect(on_progress)
+        task.signals.finished.connect(on_finished)
+        QThreadPool.globalInstance().start(task)
+
     def save_version_locally(self, version_config: VersionConfig):
         """Save version config locally in versions folder."""
         try:
@@ -7420,8 +8352,7 @@ class MainWindow(QMainWindow):
                 'locked': version_config.is_locked()
             }
 
-            with open(version_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            _save_json(version_file, data)
         except Exception as e:
             print(f"Failed to save version locally: {e}")
 
@@ -7458,14 +8389,16 @@ class MainWindow(QMainWindow):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self.fetch_configs()
             self.show_version_selection()
+            self.fetch_configs()
 
     def save_all(self):
         """Save all changes to GitHub using single-file format."""
         if not self.github_api:
             QMessageBox.warning(self, "Not Connected", "Please configure GitHub connection first.")
             return
+        if self._fetch_in_progress():
+            return
 
         config_path = self.editor_config.get('github', {}).get('config_path', '')
 
@@ -7475,17 +8408,17 @@ class MainWindow(QMainWindow):
         # Save config.json if modified
         if self.modpack_config:
             config_file = f"{config_path}/config.json" if config_path else "config.json"
-            config_content = json.dumps(self.modpack_config.to_dict(), indent=2)
+            config_content = _json_dumps(self.modpack_config.to_dict())
             changes.append((config_file, config_content, self.file_shas.get('config.json')))
 
         # Save mods.json (all mods)
         mods_file = f"{config_path}/mods.json" if config_path else "mods.json"
-        mods_content = json.dumps([m.to_dict() for m in self.all_mods], indent=2)
+        mods_content = _json_dumps([m.to_dict() for m in self.all_mods])
         changes.append((mods_file, mods_content, self.file_shas.get('mods.json')))
 
         # Save files.json (all files)
         files_file = f"{config_path}/files.json" if config_path else "files.json"
-        files_content = json.dumps({'files': [f.to_dict() for f in self.all_files]}, indent=2)
+        files_content = _json_dumps({'files': [f.to_dict() for f in self.all_files]})
         changes.append((files_file, files_content, self.file_shas.get('files.json')))
 
         # Save deletes.json (all versions' deletes)
@@ -7501,80 +8434,66 @@ class MainWindow(QMainWindow):
             'safetyMode': True,
             'deletions': deletions_list
         }
-        deletes_content = json.dumps(deletes_obj, indent=2)
+        deletes_content = _json_dumps(deletes_obj)
         changes.append((deletes_file, deletes_content, self.file_shas.get('deletes.json')))
 
+        changes = self._drop_unchanged(changes)
         if not changes:
+            # The repository already matches, so there is nothing left unsaved
+            self._mark_all_saved()
             QMessageBox.information(self, "No Changes", "No changes to save.")
             return
 
-        # Show progress (without cancel button - disable close)
-        progress = QProgressDialog("Saving to GitHub...", None, 0, len(changes), self)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.setCancelButton(None)  # Remove cancel button
-        progress.setWindowFlags(progress.windowFlags() & ~Qt.WindowType.WindowCloseButtonHint)
-
-        errors = []
-
-        for i, (path, content, sha) in enumerate(changes):
-            progress.setValue(i)
-            progress.setLabelText(f"Saving {path}...")
-            QApplication.processEvents()
-
-            try:
-                result = self.github_api.create_or_update_file(
-                    path, content, f"Update {path} via Config Editor", sha
-                )
-                # Update SHA for future saves
-                new_sha = result.get('content', {}).get('sha')
-                if new_sha:
-                    filename = path.split('/')[-1]
-                    self.file_shas[filename] = new_sha
-
-            except Exception as e:
-                errors.append(f"{path}: {str(e)}")
-
-        progress.setValue(len(changes))
+        self._upload_changes(changes, "Update {path} via Config Editor",
+                             "Saving to GitHub...", self._on_all_saved, show_paths=True)
 
+    def _on_all_saved(self, errors: List[str]):
+        """Finish save_all once its upload has completed."""
         if errors:
             QMessageBox.warning(self, "Save Errors",
                 f"Some files failed to save:\n\n" + "\n".join(errors))
         else:
-            # Mark all versions as not modified
-            for config in self.versions.values():
-                config.modified = False
-            # Clear the unsaved deletions flag
-            self._has_unsaved_deletions = False
+            self._mark_all_saved()
             QMessageBox.information(self, "Saved", "All changes saved to GitHub successfully!")
 
+    def _mark_all_saved(self):
+        """Clear the modified state once the repository matches the editor."""
+        # Mark all versions as not modified
+        for config in self.versions.values():
+            config.modified = False
+        # Clear the unsaved deletions flag
+        self._has_unsaved_deletions = False
+
     def validate_all(self):
         """Validate all configurations."""
         errors = []
 
         for version, config in self.versions.items():
-            # Check mods
-            ids_seen = set()
-            for i, mod in enumerate(config.mods):
-                if not mod.id:
-                    errors.append(f"[{version}] Mod {i+1}: Missing ID")
-                elif mod.id in ids_seen:
-                    errors.append(f"[{version}] Mod {i+1}: Duplicate ID '{mod.id}'")
-                else:
-                    ids_seen.add(mod.id)
-
-                if not mod.display_name:
-                    errors.append(f"[{version}] Mod {i+1}: Missing display name")
+            # Check mods - most configs are clean, so confirm that with set/all()
+            # checks first and only walk the mods one by one when something is off
+            mod_ids = [mod.id for mod in config.mods]
+            mods_ok = (all(mod_ids) and len(set(mod_ids)) == len(mod_ids)
+                       and all(mod.display_name for mod in config.mods))
+            if not mods_ok:
+                ids_seen = set()
+                for i, mod in enumerate(config.mods):
+                    if not mod.id:
+                        errors.append(f"[{version}] Mod {i+1}: Missing ID")
+                    elif mod.id in ids_seen:
+                        errors.append(f"[{version}] Mod {i+1}: Duplicate ID '{mod.id}'")
+                    else:
+                        ids_seen.add(mod.id)
+
+                    if not mod.display_name:
+                        errors.append(f"[{version}] Mod {i+1}: Missing display name")
 
             # Check files
-            for i, f in enumerate(config.files):
-                if not f.url:
-                    errors.append(f"[{version}] File {i+1}: Missing URL")
+            bad_files = [i for i, f in enumerate(config.files) if not f.url]
+            errors.extend(f"[{version}] File {i+1}: Missing URL" for i in bad_files)
 
             # Check deletes
-            for i, d in enumerate(config.deletes):
-                if not d.path:
-                    errors.append(f"[{version}] Delete {i+1}: Missing path")
+            bad_deletes = [i for i, d in enumerate(config.deletes) if not d.path]
+            errors.extend(f"[{version}] Delete {i+1}: Missing path" for i in bad_deletes)
 
         if errors:
             QMessageBox.warning(self, "Validation Errors",
@@ -7708,7 +8627,7 @@ class MainWindow(QMainWindow):
             # Stop icon load threads in version editor page
             if hasattr(self, 'version_editor_page') and self.version_editor_page:
                 try:
-                    self.version_editor_page._cancel_icon_load_threads()
+                    self.version_editor_page._cancel_icon_loads()
                 except Exception:
                     pass
                 
@@ -7725,6 +8644,11 @@ class MainWindow(QMainWindow):
                     pass
         except Exception:
             pass
+
+        # Let pending background saves (e.g. editor config) finish writing
+        SaveTask.pool().waitForDone(2000)
+        QThreadPool.globalInstance().waitForDone(2000)
+        ModIconTask.pool().waitForDone(1000)
     
     def closeEvent(self, event):
         """Handle window close."""
@@ -7760,6 +8684,7 @@ def main():
     """Main entry point."""
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
     
     # Load custom themes first
     load_custom_themes()
@@ -7769,16 +8694,15 @@ def main():
     saved_theme = "light"  # Default to light theme
     if config_path.exists():
         try:
-            with open(config_path, 'r') as f:
-                editor_config = json.load(f)
-                saved_theme = editor_config.get('theme', 'light')
+            editor_config = _read_json(config_path)
+            saved_theme = editor_config.get('theme', 'light')
         except Exception:
             pass
     
     # Apply initial theme for loading dialog
     set_current_theme(saved_theme)
     initial_theme = THEMES.get(saved_theme, THEMES["light"])
-    app.setStyleSheet(generate_stylesheet(initial_theme))
+    apply_stylesheet(initial_theme)
 
     # Start preloading icons immediately
     ModBrowserDialog.start_startup_preload()
@@ -7793,13 +8717,9 @@ def main():
     timeout_timer.start(10000)
     
     loading_dialog.start_checking()
-    loading_dialog.show()
-    
-    # Process events while loading with small delay to reduce CPU usage
-    import time
-    while loading_dialog.isVisible():
-        app.processEvents()
-        time.sleep(0.01)  # 10ms delay to reduce CPU consumption
+    # exec() runs the event loop until the dialog accepts, so it sleeps between
+    # events and paints once per frame instead of being polled every 10ms
+    loading_dialog.exec()
     
     timeout_timer.stop()
     
@@ -0,0 +1,43 @@
+"""Tests for the mod browser's background fetch threads."""
+
+import os
+import sys
+import unittest
+import urllib.error
+from unittest import mock
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config_editor  # noqa: E402
+
+
+def _fail(*args, **kwargs):
+    raise urllib.error.URLError('network down')
+
+
+class FetchThreadErrorTest(unittest.TestCase):
+    """A failed request must surface through error_occurred, not crash run()."""
+
+    def _assert_error_emitted(self, thread):
+        errors = []
+        thread.error_occurred.connect(errors.append)
+        with mock.patch('urllib.request.urlopen', _fail):
+            thread.run()
+        self.assertEqual(len(errors), 1)
+        self.assertIn('network down', errors[0])
+
+    def test_search_thread(self):
+        for source in ('modrinth', 'curseforge'):
+            with self.subTest(source=source):
+                self._assert_error_emitted(config_editor.ModSearchThread(source, 'jei'))
+
+    def test_version_fetch_thread(self):
+        self._assert_error_emitted(config_editor.ModVersionFetchThread('modrinth', 'abc123'))
+
+    def test_description_fetch_thread(self):
+        self._assert_error_emitted(config_editor.ModDescriptionFetchThread('modrinth', 'abc123'))
+
+
+if __name__ == '__main__':
+    unittest.main()
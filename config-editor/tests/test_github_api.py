@@ -0,0 +1,198 @@
+"""Tests for GitHubAPI's keep-alive connections and ETag revalidation."""
+
+import http.client
+import io
+import json
+import os
+import sys
+import unittest
+import urllib.error
+from email.message import Message
+from unittest import mock
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config_editor  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, status, body=b'', headers=None, will_close=False):
+        self.status = status
+        self.headers = headers or {}
+        self.will_close = will_close
+        self._body = body
+
+    def read(self):
+        return self._body
+
+
+class FakeHTTPSConnection:
+    """Stand-in for http.client.HTTPSConnection that replays scripted outcomes.
+
+    Each entry in `script` is either a FakeResponse or an exception to raise
+    from getresponse().
+    """
+    script = []
+    created = []
+
+    def __init__(self, host, timeout=None, context=None):
+        self.host = host
+        self.sock = None
+        self.closed = False
+        self.requests = []
+        FakeHTTPSConnection.created.append(self)
+
+    def request(self, method, path, body=None, headers=None):
+        self.requests.append((method, path, dict(headers or {})))
+
+    def getresponse(self):
+        outcome = FakeHTTPSConnection.script.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    def close(self):
+        self.closed = True
+
+
+def _json(obj, etag=None):
+    return FakeResponse(200, json.dumps(obj).encode('utf-8'), {'ETag': etag} if etag else {})
+
+
+class GitHubAPITestCase(unittest.TestCase):
+
+    def setUp(self):
+        FakeHTTPSConnection.script = []
+        FakeHTTPSConnection.created = []
+        patches = [
+            mock.patch('http.client.HTTPSConnection', FakeHTTPSConnection),
+            mock.patch('urllib.request.getproxies', return_value={}),
+            mock.patch.dict(config_editor.GitHubAPI._etag_cache, clear=True),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def api(self, token='token-a'):
+        return config_editor.GitHubAPI('https://github.com/owner/repo', token)
+
+    def sent_headers(self):
+        return [req[2] for conn in FakeHTTPSConnection.created for req in conn.requests]
+
+
+class KeepAliveTest(GitHubAPITestCase):
+
+    def test_connection_is_reused(self):
+        FakeHTTPSConnection.script = [_json({'a': 1}), _json({'b': 2})]
+        api = self.api()
+        self.assertEqual(api._request('GET', '/repos/owner/repo'), {'a': 1})
+        self.assertEqual(api._request('GET', '/repos/owner/repo'), {'b': 2})
+        self.assertEqual(len(FakeHTTPSConnection.created), 1)
+
+    def test_dropped_idle_connection_is_retried_on_a_new_one(self):
+        FakeHTTPSConnection.script = [
+            _json({'a': 1}),
+            http.client.RemoteDisconnected('closed by server'),
+            _json({'b': 2}),
+        ]
+        api = self.api()
+        api._request('GET', '/repos/owner/repo')
+        self.assertEqual(api._request('GET', '/repos/owner/repo'), {'b': 2})
+        first, second = FakeHTTPSConnection.created
+        self.assertTrue(first.closed)
+        self.assertEqual(len(second.requests), 1)
+
+    def test_failure_on_a_new_connection_is_not_retried(self):
+        FakeHTTPSConnection.script = [ConnectionResetError('reset')]
+        with self.assertRaises(ConnectionResetError):
+            self.api()._request('GET', '/repos/owner/repo')
+        self.assertEqual(len(FakeHTTPSConnection.created), 1)
+
+    def test_closing_response_is_not_pooled(self):
+        FakeHTTPSConnection.script = [
+            FakeResponse(200, b'{}', will_close=True), _json({}),
+        ]
+        api = self.api()
+        api._request('GET', '/repos/owner/repo')
+        api._request('GET', '/repos/owner/repo')
+        self.assertEqual(len(FakeHTTPSConnection.created), 2)
+        self.assertTrue(FakeHTTPSConnection.created[0].closed)
+
+    def test_error_status_raises(self):
+        FakeHTTPSConnection.script = [FakeResponse(404, b'Not Found')]
+        with self.assertRaises(config_editor.GitHubAPIError) as ctx:
+            self.api()._request('GET', '/repos/owner/repo')
+        self.assertEqual(ctx.exception.status_code, 404)
+
+    def test_redirect_falls_back_to_urllib(self):
+        FakeHTTPSConnection.script = [FakeResponse(301, b'', {'Location': 'elsewhere'})]
+        response = mock.MagicMock()
+        response.__enter__.return_value = response
+        response.headers = {}
+        response.read.return_value = b'{"moved": true}'
+        with mock.patch('urllib.request.urlopen', return_value=response) as urlopen:
+            result = self.api()._request('GET', '/repos/owner/repo')
+        self.assertEqual(result, {'moved': True})
+        req = urlopen.call_args[0][0]
+        self.assertEqual(req.full_url, 'https://api.github.com/repos/owner/repo')
+
+
+class ETagCacheTest(GitHubAPITestCase):
+    LISTING = '/repos/owner/repo/contents/?ref=main'
+
+    def test_not_modified_returns_cached_result(self):
+        FakeHTTPSConnection.script = [
+            _json([{'name': 'mods.json'}], etag='"v1"'),
+            FakeResponse(304),
+        ]
+        api = self.api()
+        first = api._request('GET', self.LISTING)
+        second = api._request('GET', self.LISTING)
+        self.assertEqual(second, [{'name': 'mods.json'}])
+        self.assertIsNot(second, first)  # Each caller gets its own copy
+        self.assertEqual(self.sent_headers()[1].get('If-None-Match'), '"v1"')
+
+    def test_not_modified_through_urllib_returns_cached_result(self):
+        config_editor.GitHubAPI._etag_cache[('token-a', self.LISTING)] = ('"v1"', b'[1]')
+        not_modified = urllib.error.HTTPError(
+            'https://api.github.com' + self.LISTING, 304, 'Not Modified', Message(), io.BytesIO())
+        with mock.patch('urllib.request.getproxies', return_value={'https': 'proxy'}), \
+                mock.patch('urllib.request.urlopen', side_effect=not_modified) as urlopen:
+            self.assertEqual(self.api()._request('GET', self.LISTING), [1])
+        self.assertEqual(urlopen.call_args[0][0].get_header('If-none-match'), '"v1"')
+
+    def test_tokens_do_not_share_entries(self):
+        FakeHTTPSConnection.script = [
+            _json(['private'], etag='"a"'),
+            _json(['public'], etag='"b"'),
+        ]
+        self.api('token-a')._request('GET', self.LISTING)
+        self.assertEqual(self.api('token-b')._request('GET', self.LISTING), ['public'])
+        self.assertNotIn('If-None-Match', self.sent_headers()[1])
+
+    def test_blobs_are_not_cached(self):
+        blob = '/repos/owner/repo/git/blobs/abc123'
+        FakeHTTPSConnection.script = [_json({'content': ''}, etag='"x"')] * 2
+        api = self.api()
+        api._request('GET', blob)
+        api._request('GET', blob)
+        self.assertEqual(config_editor.GitHubAPI._etag_cache, {})
+        self.assertNotIn('If-None-Match', self.sent_headers()[1])
+
+    def test_cache_evicts_least_recently_used_entry(self):
+        size = config_editor.ETAG_CACHE_SIZE
+        api = self.api()
+        FakeHTTPSConnection.script = [_json([], etag='"e"') for _ in range(size)]
+        for i in range(size):
+            api._request('GET', f'/repos/owner/repo/contents/{i}')
+        FakeHTTPSConnection.script = [FakeResponse(304), _json([], etag='"e"')]
+        api._request('GET', '/repos/owner/repo/contents/0')  # Revalidating counts as a use
+        api._request('GET', '/repos/owner/repo/contents/new')
+        keys = [endpoint for _, endpoint in config_editor.GitHubAPI._etag_cache]
+        self.assertEqual(len(keys), size)
+        self.assertIn('/repos/owner/repo/contents/0', keys)
+        self.assertNotIn('/repos/owner/repo/contents/1', keys)
+
+if __name__ == '__main__':
+    unittest.main()
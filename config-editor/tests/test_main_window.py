@@ -0,0 +1,79 @@
+"""Tests for MainWindow's handling of the config data model."""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config_editor  # noqa: E402
+
+
+class ConfigFetchBlocksEditsTest(unittest.TestCase):
+    """Edits and saves made while configs load would be lost when the fetch lands."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = config_editor.QApplication.instance() or config_editor.QApplication([])
+
+    def setUp(self):
+        self._home = tempfile.TemporaryDirectory()
+        patches = [
+            mock.patch.dict(os.environ, {'HOME': self._home.name}),
+            mock.patch.object(config_editor.MainWindow, 'check_setup', lambda self: None),
+            mock.patch.object(config_editor.QMessageBox, 'information'),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.window = config_editor.MainWindow()
+        self.window.github_api = mock.Mock()
+        self.addCleanup(self._home.cleanup)
+
+    def _start_blocked_fetch(self):
+        release = threading.Event()
+
+        def run(task):
+            release.wait(5)
+            task.signals.finished.emit({name: (None, None, None) for name in task.FILES})
+
+        p = mock.patch.object(config_editor.ConfigFetchTask, 'run', run)
+        p.start()
+        self.addCleanup(p.stop)
+        self.addCleanup(self._wait_for_fetch)
+        self.addCleanup(release.set)
+        self.window.fetch_configs()
+        return release
+
+    def _wait_for_fetch(self):
+        config_editor.QThreadPool.globalInstance().waitForDone(5000)
+        self.app.processEvents()
+
+    def test_save_refused_while_fetching(self):
+        release = self._start_blocked_fetch()
+        with mock.patch.object(self.window, '_upload_changes') as upload:
+            self.window.save_all()
+            upload.assert_not_called()
+            config_editor.QMessageBox.information.assert_called_once()
+
+            release.set()
+            self._wait_for_fetch()
+            self.assertIsNone(self.window._fetch_signals)
+            self.assertIsNone(self.window._fetch_progress)
+            self.window.save_all()
+            upload.assert_called_once()
+
+    def test_open_version_refused_while_fetching(self):
+        self.window.versions = {'1.0.0': config_editor.VersionConfig('1.0.0')}
+        self._start_blocked_fetch()
+        with mock.patch.object(self.window.version_editor_page, 'load_version') as load:
+            self.window.open_version('1.0.0')
+            load.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
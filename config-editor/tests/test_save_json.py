@@ -0,0 +1,50 @@
+"""Tests for the atomic JSON save helpers."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config_editor  # noqa: E402
+
+
+class WriteAtomicTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        self.path = self.dir / 'config.json'
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_replaces_file_and_leaves_no_temp_files(self):
+        self.path.write_bytes(b'old')
+        config_editor._write_atomic(self.path, b'new')
+        self.assertEqual(self.path.read_bytes(), b'new')
+        self.assertEqual(os.listdir(self.dir), ['config.json'])
+
+    def test_failed_replace_removes_temp_file(self):
+        self.path.write_bytes(b'old')
+        with mock.patch('os.replace', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                config_editor._write_atomic(self.path, b'new')
+        self.assertEqual(self.path.read_bytes(), b'old')
+        self.assertEqual(os.listdir(self.dir), ['config.json'])
+
+    def test_queued_saves_keep_newest_snapshot(self):
+        for i in range(50):
+            config_editor.SaveTask.submit(config_editor.SaveTask(self.path, {'n': i}))
+        config_editor.SaveTask.pool().waitForDone()
+        self.assertEqual(json.loads(self.path.read_bytes()), {'n': 49})
+        self.assertEqual(os.listdir(self.dir), ['config.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()